@@ -20,6 +20,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import collections
 import logging
 import os
 import sys
@@ -38,11 +39,49 @@ from bleachbit.Options import options
 from bleachbit.FileUtilities import bytes_to_human
 from bleachbit.Log import GtkLoggerHandler, set_root_log_level
 
-from bleachbit.QtGuiPreferences import QtPreferencesDialog
+from bleachbit.QtGuiPreferences import show_preferences_dialog
 from bleachbit.QtSystemInformation import QtSystemInformationDialog
 
 logger = logging.getLogger('bleachbit')
 
+
+_FIXED_FONT = None
+_ICON_CACHE = {}
+
+
+def _fixed_font():
+    """Return the system fixed-width font, resolved only once."""
+    global _FIXED_FONT
+    if _FIXED_FONT is None:
+        _FIXED_FONT = QtGui.QFontDatabase.systemFont(
+            QtGui.QFontDatabase.FixedFont)
+    return _FIXED_FONT
+
+
+def _icon(path):
+    """Return a cached QIcon so rebuilds don't re-decode the image."""
+    icon = _ICON_CACHE.get(path)
+    if icon is None:
+        icon = _ICON_CACHE[path] = QtGui.QIcon(path)
+    return icon
+
+
+def _get_tree_states(cleaner_id, opt_ids):
+    """
+    Fetch the saved tree states for a cleaner and all its options in
+    one pass, returned as {None: bool, opt_id: bool, ...}.
+    Uses options.get_tree_dict() when the core provides it; otherwise
+    falls back to per-key get_tree() calls.
+    """
+    get_tree_dict = getattr(options, 'get_tree_dict', None)
+    if get_tree_dict is not None:
+        return get_tree_dict(cleaner_id)
+    states = {None: options.get_tree(cleaner_id, None)}
+    for opt_id in opt_ids:
+        states[opt_id] = options.get_tree(cleaner_id, opt_id)
+    return states
+
+
 def get_current_locale_qt(info = False) -> str:
     """
     Returns the current locale given by QtCore.QLocale().name()
@@ -69,12 +108,42 @@ class BleachBitQtMainWindow(QtWidgets.QMainWindow):
     - total size cleaned in the status bar
     """
 
+    # Flags shared by every cleaner/option row, computed once instead
+    # of flags()|ItemIsUserCheckable round-trips per item
+    _ITEM_FLAGS = (QtCore.Qt.ItemIsUserCheckable | QtCore.Qt.ItemIsEnabled
+                   | QtCore.Qt.ItemIsSelectable)
+
     def __init__(self, auto_exit=False, parent=None):
         super().__init__(parent)
         self._auto_exit = auto_exit
         self.worker = None
         self._worker_gen = None
         self.start_time = None
+        # O(1) lookup maps filled by _populate_cleaners_tree()
+        self._cleaner_items = {}
+        self._option_items = {}
+        self._cleaners_registered = False
+        # Cleaner keys sorted by display name, computed per population
+        self._sorted_cleaner_keys = []
+        # Size texts deferred for collapsed cleaners, applied on expand
+        self._pending_sizes = {}
+
+        # Worker can emit progress callbacks far faster than the screen
+        # refreshes; coalesce them and repaint at most every 33 ms.
+        self._pending_progress = None
+        self._pending_total = None
+        self._progress_timer = QtCore.QTimer(self)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
+        # Buffer log lines and append them to the widget in batches so
+        # text layout runs once per flush instead of once per line.
+        self._log_buf = collections.deque()
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setInterval(50)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
 
         self.setWindowTitle(APP_NAME)
         self.resize(1000, 800)
@@ -116,11 +185,17 @@ class BleachBitQtMainWindow(QtWidgets.QMainWindow):
 
         # Left: tree of cleaners/options
         self.tree = QtWidgets.QTreeWidget()
+        # Rows are all single-line name+size, so let Qt skip per-item
+        # height calculation and expand animations.
+        self.tree.setUniformRowHeights(True)
+        self.tree.setAnimated(False)
+        self.tree.setExpandsOnDoubleClick(False)
         self.tree.setHeaderLabels([_("Name"), _("Size")])
         self.tree.header().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents) # Stretch
         self.tree.header().setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch) # ResizeToContents)
         self.tree
         self.tree.itemChanged.connect(self._on_tree_item_changed)
+        self.tree.itemExpanded.connect(self._on_tree_item_expanded)
         splitter.addWidget(self.tree) #hbox.addWidget(self.tree, 2)
 
         # Right side
@@ -133,19 +208,19 @@ class BleachBitQtMainWindow(QtWidgets.QMainWindow):
         right_layout.addLayout(toolbar_layout)
 
         self.preview_button = QtWidgets.QPushButton(_("Preview"))
-        self.preview_button.setIcon(QtGui.QIcon("icons/preview.png"))
+        self.preview_button.setIcon(_icon("icons/preview.png"))
         self.preview_button.setIconSize(QtCore.QSize(18, 18))
         self.preview_button.clicked.connect(self._on_preview_clicked)
         toolbar_layout.addWidget(self.preview_button)
 
         self.clean_button = QtWidgets.QPushButton(_("Clean"))
-        self.clean_button.setIcon(QtGui.QIcon("icons/clean.png"))
+        self.clean_button.setIcon(_icon("icons/clean.png"))
         self.clean_button.setIconSize(QtCore.QSize(18, 18))
         self.clean_button.clicked.connect(self._on_clean_clicked)
         toolbar_layout.addWidget(self.clean_button)
 
         self.stop_button = QtWidgets.QPushButton(_("Abort"))
-        self.stop_button.setIcon(QtGui.QIcon("icons/abort.png"))
+        self.stop_button.setIcon(_icon("icons/abort.png"))
         self.stop_button.setIconSize(QtCore.QSize(18, 18))
         self.stop_button.clicked.connect(self.cb_stop_operations)
         self.stop_button.setEnabled(False)
@@ -165,8 +240,11 @@ class BleachBitQtMainWindow(QtWidgets.QMainWindow):
         self.log_edit = QtWidgets.QPlainTextEdit()
         self.log_edit.setReadOnly(True)
         self.log_edit.setLineWrapMode(QtWidgets.QPlainTextEdit.LineWrapMode.NoWrap)
-        font = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
-        self.log_edit.setFont(font)
+        # Bound document size so long runs keep O(1) append cost;
+        # Qt discards the oldest blocks beyond the limit.
+        self.log_edit.setMaximumBlockCount(5000)
+        self.log_edit.setCenterOnScroll(False)
+        self.log_edit.setFont(_fixed_font())
         right_layout.addWidget(self.log_edit, 1)
 
         # Status bar: total cleaned size
@@ -267,8 +345,8 @@ class BleachBitQtMainWindow(QtWidgets.QMainWindow):
         )
 
     def _show_preferences_dialog(self):
-        dlg = QtPreferencesDialog(self, cb_refresh_operations=self.cb_refresh_operations)
-        dlg.exec()
+        show_preferences_dialog(
+            self, cb_refresh_operations=self.cb_refresh_operations)
 
     def _show_sysinfo_dialog(self):
         dlg = QtSystemInformationDialog(self)
@@ -308,83 +386,247 @@ class BleachBitQtMainWindow(QtWidgets.QMainWindow):
 
     # ---------- cleaners tree ----------
 
-    def _populate_cleaners_tree(self):
+    def _populate_cleaners_tree(self, rebuild=True):
         """
         Register cleaners and populate the tree widget with
         backends and options. This is synchronous for now.
+
+        When rebuild is False and the tree already has items, only the
+        delta against backends is applied (see _refresh_cleaners_tree)
+        instead of clearing and rebuilding everything.
         """
-        self.update_progress_bar("Loading cleaners…")
-        try:
-            gen = register_cleaners(self.update_progress_bar, lambda: None)
-            for _ in gen:
-                QtWidgets.QApplication.processEvents()
-        except Exception:
-            logger.exception("Error registering cleaners")
-        finally:
-            self.update_progress_bar(0.0)
+        if not self._cleaners_registered:
+            self.update_progress_bar("Loading cleaners…")
+            try:
+                gen = register_cleaners(self.update_progress_bar, lambda: None)
+                # Pump the event loop at most every 33 ms; draining the
+                # queue on every yield is expensive and invisible to the
+                # user. Excluding user input also keeps the tree handlers
+                # from re-entering during population.
+                last_pump = 0.0
+                for _ in gen:
+                    now = time.monotonic()
+                    if now - last_pump > 0.033:
+                        QtWidgets.QApplication.processEvents(
+                            QtCore.QEventLoop.ExcludeUserInputEvents)
+                        last_pump = now
+            except Exception:
+                logger.exception("Error registering cleaners")
+            finally:
+                self.update_progress_bar(0.0)
+            self._cleaners_registered = True
 
-        self.tree.clear()
+        if not rebuild and self._cleaner_items:
+            self._refresh_cleaners_tree()
+            return
 
-        hidden_cleaners = []
-        # Build tree: top-level = cleaners, children = options
-        for key in sorted(backends):
-            backend = backends[key]
-            options_list = list(backend.get_options())
-            if not options_list:
-                # localizations has no options, so it should be hidden
-                # https://github.com/az0/bleachbit/issues/110
-                continue
-
-            cleaner_name = backend.get_name()
-            cleaner_id = backend.get_id()
-            cleaner_checked = bool(options.get_tree(cleaner_id, None))
-
-            if not cleaner_checked and options.get('auto_hide') and backend.auto_hide():
-                hidden_cleaners.append(cleaner_id)
-                continue
-
-            cleaner_item = QtWidgets.QTreeWidgetItem(self.tree)
-            cleaner_item.setText(0, cleaner_name)
-            cleaner_item.setText(1, "")
-            cleaner_item.setFlags(
-                cleaner_item.flags() | QtCore.Qt.ItemIsUserCheckable
-            )
-            cleaner_item.setCheckState(
-                0, QtCore.Qt.Checked if cleaner_checked else QtCore.Qt.Unchecked
-            )
-            cleaner_item.setData(
-                0, QtCore.Qt.UserRole,
-                {"type": "cleaner", "id": cleaner_id}
-            )
+        # Suspend painting and signals for the whole population so the
+        # tree repaints once instead of once per inserted item.
+        self.tree.setUpdatesEnabled(False)
+        blocked = self.tree.blockSignals(True)
 
-            # Options
-            for opt_id, opt_name in options_list:
-                opt_checked = bool(options.get_tree(cleaner_id, opt_id))
+        self.tree.clear()
+        self._cleaner_items.clear()
+        self._option_items.clear()
+        self._pending_sizes.clear()
 
-                opt_item = QtWidgets.QTreeWidgetItem(cleaner_item)
-                blocked = opt_item.treeWidget().blockSignals(True) # block signals to prevent recursive emits
-                opt_item.setText(0, opt_name)
-                opt_item.setText(1, "")
-                opt_item.setFlags(
-                    opt_item.flags() | QtCore.Qt.ItemIsUserCheckable
-                )
-                opt_item.setCheckState(
-                    0, QtCore.Qt.Checked if opt_checked else QtCore.Qt.Unchecked
-                )
-                opt_item.setData(
-                    0, QtCore.Qt.UserRole,
-                    {"type": "option", "cleaner_id": cleaner_id, "id": opt_id}
-                )
-                opt_item.treeWidget().blockSignals(blocked) # remove block 
+        hidden_cleaners = []
+        top_items = []
+        # Build tree: top-level = cleaners, children = options.
+        # Items are constructed detached and attached in one batch below
+        # so the model emits one insertRows per cleaner instead of one
+        # per item. Sort once by localized display name; the order is
+        # reused by the in-place refresh.
+        self._sorted_cleaner_keys = sorted(
+            backends.keys(), key=lambda k: backends[k].get_name().lower())
+        for key in self._sorted_cleaner_keys:
+            cleaner_item = self._build_cleaner_item(
+                backends[key], hidden_cleaners)
+            if cleaner_item is not None:
+                top_items.append(cleaner_item)
+
+        self.tree.addTopLevelItems(top_items)
 
         if hidden_cleaners:
             logger.debug("automatically hid %d cleaners: %s", len(
                 hidden_cleaners), ', '.join(hidden_cleaners))
 
+        # Expand while updates are still disabled so the geometry for
+        # all rows is computed in the single layout pass that follows
+        # re-enabling updates.
         self.tree.expandAll()
 
+        self.tree.blockSignals(blocked)
+        self.tree.setUpdatesEnabled(True)
+        self.tree.viewport().update()
+
+    def _build_cleaner_item(self, backend, hidden_cleaners):
+        """
+        Build a detached tree item for one cleaner with its option
+        children and register both in the lookup maps. Returns None
+        for cleaners that should not be shown.
+        """
+        options_list = list(backend.get_options())
+        if not options_list:
+            # localizations has no options, so it should be hidden
+            # https://github.com/az0/bleachbit/issues/110
+            return None
+
+        cleaner_name = backend.get_name()
+        cleaner_id = backend.get_id()
+        tree_state = _get_tree_states(
+            cleaner_id, [opt[0] for opt in options_list])
+        cleaner_checked = bool(tree_state.get(None, False))
+
+        if not cleaner_checked and options.get('auto_hide') and backend.auto_hide():
+            hidden_cleaners.append(cleaner_id)
+            return None
+
+        # Locals for the hot loop below
+        checked_state = QtCore.Qt.Checked
+        unchecked_state = QtCore.Qt.Unchecked
+
+        cleaner_item = QtWidgets.QTreeWidgetItem()
+        cleaner_item.setText(0, cleaner_name)
+        cleaner_item.setText(1, "")
+        cleaner_item.setFlags(self._ITEM_FLAGS)
+        cleaner_item.setCheckState(
+            0, checked_state if cleaner_checked else unchecked_state
+        )
+        cleaner_item.setData(
+            0, QtCore.Qt.UserRole,
+            {"type": "cleaner", "id": cleaner_id}
+        )
+        self._cleaner_items[cleaner_id] = cleaner_item
+        self._option_items[cleaner_id] = {}
+
+        # Options
+        opt_items = []
+        for opt_id, opt_name in options_list:
+            opt_checked = bool(tree_state.get(opt_id, False))
+
+            # Resolve the warning text now so toggling the option
+            # later does not have to call back into the backend.
+            warning = backend.get_warning(opt_id)
+            description = backend.get_option_description(
+                opt_id) if warning else None
+
+            opt_item = QtWidgets.QTreeWidgetItem()
+            opt_item.setText(0, opt_name)
+            opt_item.setText(1, "")
+            opt_item.setFlags(self._ITEM_FLAGS)
+            opt_item.setCheckState(
+                0, checked_state if opt_checked else unchecked_state
+            )
+            opt_item.setData(
+                0, QtCore.Qt.UserRole,
+                {"type": "option", "cleaner_id": cleaner_id,
+                 "id": opt_id, "cleaner_name": cleaner_name,
+                 "warning": warning, "description": description}
+            )
+            opt_items.append(opt_item)
+            self._option_items[cleaner_id][opt_id] = opt_item
+
+        cleaner_item.addChildren(opt_items)
+        return cleaner_item
+
+    def _refresh_cleaners_tree(self):
+        """
+        Diff the existing tree items against backends and apply only
+        the delta: add newly visible cleaners, drop hidden or removed
+        ones, and re-sync check states and labels on the rest.
+        """
+        self.tree.setUpdatesEnabled(False)
+        blocked = self.tree.blockSignals(True)
+        try:
+            hidden_cleaners = []
+            keep = set()
+            # Re-sort only if the set of cleaners changed
+            if set(backends) != set(self._sorted_cleaner_keys):
+                self._sorted_cleaner_keys = sorted(
+                    backends.keys(),
+                    key=lambda k: backends[k].get_name().lower())
+            for rank, key in enumerate(self._sorted_cleaner_keys):
+                backend = backends[key]
+                cleaner_id = backend.get_id()
+                cleaner_item = self._cleaner_items.get(cleaner_id)
+                if cleaner_item is None:
+                    new_item = self._build_cleaner_item(
+                        backend, hidden_cleaners)
+                    if new_item is not None:
+                        # Insert at the item's rank among the cleaners
+                        # currently in the tree to keep the display-name
+                        # sort order from the full build.
+                        pos = sum(
+                            1 for k in self._sorted_cleaner_keys[:rank]
+                            if k in self._cleaner_items)
+                        self.tree.insertTopLevelItem(pos, new_item)
+                        new_item.setExpanded(True)
+                        keep.add(cleaner_id)
+                    continue
+
+                options_list = list(backend.get_options())
+                tree_state = _get_tree_states(
+                    cleaner_id, [opt[0] for opt in options_list])
+                cleaner_checked = bool(tree_state.get(None, False))
+                if not options_list or (
+                        not cleaner_checked and options.get('auto_hide')
+                        and backend.auto_hide()):
+                    # now hidden; removed below
+                    continue
+
+                keep.add(cleaner_id)
+                cleaner_name = backend.get_name()
+                if cleaner_item.text(0) != cleaner_name:
+                    cleaner_item.setText(0, cleaner_name)
+                cleaner_state = (QtCore.Qt.Checked if cleaner_checked
+                                 else QtCore.Qt.Unchecked)
+                if cleaner_item.checkState(0) != cleaner_state:
+                    cleaner_item.setCheckState(0, cleaner_state)
+                opt_names = dict(options_list)
+                for opt_id, opt_item in self._option_items[cleaner_id].items():
+                    opt_name = opt_names.get(opt_id, opt_item.text(0))
+                    if opt_item.text(0) != opt_name:
+                        opt_item.setText(0, opt_name)
+                    opt_state = (QtCore.Qt.Checked
+                                 if tree_state.get(opt_id, False)
+                                 else QtCore.Qt.Unchecked)
+                    if opt_item.checkState(0) != opt_state:
+                        opt_item.setCheckState(0, opt_state)
+
+            for cleaner_id in [cid for cid in self._cleaner_items
+                               if cid not in keep]:
+                stale_item = self._cleaner_items.pop(cleaner_id)
+                self._option_items.pop(cleaner_id, None)
+                idx = self.tree.indexOfTopLevelItem(stale_item)
+                if idx >= 0:
+                    self.tree.takeTopLevelItem(idx)
+        finally:
+            self.tree.blockSignals(blocked)
+            self.tree.setUpdatesEnabled(True)
+            self.tree.viewport().update()
+
     # ---------- Tree helpers / selection ----------
 
+    def _confirm_option_warning(self, data):
+        """
+        Show the warning stored on an option item and return True if
+        the user confirmed enabling the option.
+        """
+        description = data.get("description")
+        msg = _("Warning regarding %(cleaner)s - %(description)s:\n\n%(warning)s") % \
+            {'cleaner': data.get("cleaner_name"),
+             'description': description[0],
+             'warning': data.get("warning")}
+        reply = QtWidgets.QMessageBox.question(
+            self,
+            APP_NAME,
+            msg,
+            QtWidgets.QMessageBox.Ok | QtWidgets.QMessageBox.Cancel,
+            QtWidgets.QMessageBox.Cancel,
+        )
+        return reply == QtWidgets.QMessageBox.Ok
+
     def _on_tree_item_changed(self, item, column):
         """
         Handle toggling of cleaners and options.
@@ -400,10 +642,49 @@ class BleachBitQtMainWindow(QtWidgets.QMainWindow):
 
         if data.get("type") == "cleaner":
             cleaner_id = data.get("id")
-            # Toggle all child options to same state
-            for i in range(item.childCount()):
-                child = item.child(i)
-                child.setCheckState(0, QtCore.Qt.Checked if checked else QtCore.Qt.Unchecked)
+            state = QtCore.Qt.Checked if checked else QtCore.Qt.Unchecked
+            # Toggle all child options to same state with signals
+            # blocked; otherwise every setCheckState re-enters this
+            # handler and re-runs the parent recomputation (O(N^2)).
+            deferred = []
+            blocked = self.tree.blockSignals(True)
+            try:
+                for i in range(item.childCount()):
+                    child = item.child(i)
+                    cdata = child.data(0, QtCore.Qt.UserRole)
+                    if not isinstance(cdata, dict):
+                        continue
+                    if (checked and cdata.get("warning")
+                            and child.checkState(0) != state):
+                        # Enabling this option needs its warning
+                        # confirmed; prompt after the bulk cascade.
+                        deferred.append((child, cdata))
+                        continue
+                    if child.checkState(0) != state:
+                        child.setCheckState(0, state)
+                    options.set_tree(cleaner_id, cdata.get("id"), checked)
+            finally:
+                self.tree.blockSignals(blocked)
+            for child, cdata in deferred:
+                if not self._confirm_option_warning(cdata):
+                    continue
+                blocked = self.tree.blockSignals(True)
+                try:
+                    child.setCheckState(0, QtCore.Qt.Checked)
+                finally:
+                    self.tree.blockSignals(blocked)
+                options.set_tree(cleaner_id, cdata.get("id"), True)
+            if deferred and checked:
+                # Declined warnings leave options unchecked; uncheck
+                # the cleaner again if nothing ended up enabled.
+                if not any(item.child(i).checkState(0) == QtCore.Qt.Checked
+                           for i in range(item.childCount())):
+                    blocked = self.tree.blockSignals(True)
+                    try:
+                        item.setCheckState(0, QtCore.Qt.Unchecked)
+                    finally:
+                        self.tree.blockSignals(blocked)
+                    checked = False
             # Save parent state
             options.set_tree(cleaner_id, None, checked)
 
@@ -411,28 +692,14 @@ class BleachBitQtMainWindow(QtWidgets.QMainWindow):
             cleaner_id = data.get("cleaner_id")
             opt_id = data.get("id")
 
-            # When enabling an option, show warning if backend defines one
-            if checked:
-                backend = backends.get(cleaner_id)
-                if backend:
-                    warning = backend.get_warning(opt_id)
-                    description = backend.get_option_description(opt_id)
-                    if warning:
-                        msg = _("Warning regarding %(cleaner)s - %(description)s:\n\n%(warning)s") % \
-                            {'cleaner': backend.get_name(),
-                            'description': description[0],
-                            'warning': warning}
-                        reply = QtWidgets.QMessageBox.question(
-                            self,
-                            APP_NAME,
-                            msg,
-                            QtWidgets.QMessageBox.Ok | QtWidgets.QMessageBox.Cancel,
-                            QtWidgets.QMessageBox.Cancel,
-                        )
-                        if reply != QtWidgets.QMessageBox.Ok:
-                            # revert change
-                            item.setCheckState(0, QtCore.Qt.Unchecked)
-                            return
+            # When enabling an option, show warning if backend defines
+            # one. The warning and description were resolved during
+            # population and stored on the item.
+            if checked and data.get("warning"):
+                if not self._confirm_option_warning(data):
+                    # revert change
+                    item.setCheckState(0, QtCore.Qt.Unchecked)
+                    return
 
             # Save option state
             options.set_tree(cleaner_id, opt_id, checked)
@@ -444,49 +711,32 @@ class BleachBitQtMainWindow(QtWidgets.QMainWindow):
                     parent.child(i).checkState(0) == QtCore.Qt.Checked
                     for i in range(parent.childCount())
                 )
-                blocked = parent.treeWidget().blockSignals(True) # block signals to prevent recursive emits
-                parent.setCheckState(
-                    0, QtCore.Qt.Checked if any_child_checked else QtCore.Qt.Unchecked
-                )
-                parent.treeWidget().blockSignals(blocked) # remove block
+                new_state = (QtCore.Qt.Checked if any_child_checked
+                             else QtCore.Qt.Unchecked)
+                if parent.checkState(0) != new_state:
+                    blocked = parent.treeWidget().blockSignals(True) # block signals to prevent recursive emits
+                    parent.setCheckState(0, new_state)
+                    parent.treeWidget().blockSignals(blocked) # remove block
                 options.set_tree(cleaner_id, None, any_child_checked)
 
     def get_selected_operations(self):
         """Return a list of cleaner IDs that are enabled in the tree."""
-        ret = []
-        top_count = self.tree.topLevelItemCount()
-        for i in range(top_count):
-            item = self.tree.topLevelItem(i)
-            if item.checkState(0) == QtCore.Qt.Checked:
-                data = item.data(0, QtCore.Qt.UserRole)
-                if isinstance(data, dict) and data.get("type") == "cleaner":
-                    ret.append(data.get("id"))
-        return ret
+        return [
+            cleaner_id
+            for cleaner_id, item in self._cleaner_items.items()
+            if item.checkState(0) == QtCore.Qt.Checked
+        ]
 
     def get_operation_options(self, operation):
         """For the given cleaner ID, return a list of selected option IDs."""
-        ret = []
-        top_count = self.tree.topLevelItemCount()
-        for i in range(top_count):
-            item = self.tree.topLevelItem(i)
-            data = item.data(0, QtCore.Qt.UserRole)
-            if not isinstance(data, dict):
-                continue
-            if data.get("type") != "cleaner":
-                continue
-            if data.get("id") != operation:
-                continue
-
-            if item.childCount() == 0:
-                return None
-
-            for j in range(item.childCount()):
-                child = item.child(j)
-                if child.checkState(0) == QtCore.Qt.Checked:
-                    cdata = child.data(0, QtCore.Qt.UserRole)
-                    if isinstance(cdata, dict):
-                        ret.append(cdata.get("id"))
-        return ret
+        option_items = self._option_items.get(operation)
+        if not option_items:
+            return None
+        return [
+            opt_id
+            for opt_id, item in option_items.items()
+            if item.checkState(0) == QtCore.Qt.Checked
+        ]
 
     # ---------- Worker interface / actions ----------
 
@@ -565,20 +815,26 @@ class BleachBitQtMainWindow(QtWidgets.QMainWindow):
 
     def _continue_worker(self):
         """
-        Step through the Worker generator, scheduling the next step
-        via a 0ms singleShot to keep the UI responsive.
+        Step through the Worker generator in time-boxed chunks,
+        scheduling the next chunk via a 0ms singleShot to keep the UI
+        responsive. Running many steps per event-loop round-trip avoids
+        paying queue/timer overhead for every generator yield.
         """
         if self._worker_gen is None:
             return
-        try:
-            next(self._worker_gen)
-        except StopIteration:
-            really_delete = getattr(self.worker, "really_delete", False)
-            self.worker_done(self.worker, really_delete)
-            self.worker = None
-            self._worker_gen = None
-        else:
-            QtCore.QTimer.singleShot(0, self._continue_worker)
+        deadline = time.monotonic() + 0.005
+        while True:
+            try:
+                next(self._worker_gen)
+            except StopIteration:
+                really_delete = getattr(self.worker, "really_delete", False)
+                self.worker_done(self.worker, really_delete)
+                self.worker = None
+                self._worker_gen = None
+                return
+            if time.monotonic() >= deadline:
+                break
+        QtCore.QTimer.singleShot(0, self._continue_worker)
 
     def cb_stop_operations(self):
         """Callback to stop the preview/cleaning process"""
@@ -597,29 +853,51 @@ class BleachBitQtMainWindow(QtWidgets.QMainWindow):
         """
         if tag == 'error':
             text = "ERROR: " + text
-        self.log_edit.moveCursor(QtGui.QTextCursor.End)
-        self.log_edit.insertPlainText(text)
-        if scroll:
-            self.log_edit.moveCursor(QtGui.QTextCursor.End)
+        self._log_buf.append(text.rstrip('\n'))
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append all buffered log lines to the widget in one batch."""
+        if not self._log_buf:
+            return
+        # appendPlainText() adds the text as its own block and keeps the
+        # view scrolled to the end when it already is.
+        self.log_edit.appendPlainText("\n".join(self._log_buf))
+        self._log_buf.clear()
 
     def update_progress_bar(self, status):
         """
         Callback to update the progress bar with number or text.
         - float -> percentage
         - str   -> message text
+        Updates are coalesced and flushed by _flush_progress().
         """
+        if not isinstance(status, (float, str)):
+            raise RuntimeError('unexpected type: ' + str(type(status)))
+        self._pending_progress = status
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def update_total_size(self, bytes_removed):
+        """Update the total size cleaned (status bar)."""
+        self._pending_total = bytes_removed
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        """Apply the most recent pending progress/total to the widgets."""
+        status = self._pending_progress
+        self._pending_progress = None
         if isinstance(status, float):
             self.progressbar.setRange(0, 100)
             self.progressbar.setValue(int(max(0.0, min(1.0, status)) * 100))
             self.progressbar.setFormat("%p%")
         elif isinstance(status, str):
             self.progressbar.setFormat(status)
-        else:
-            raise RuntimeError('unexpected type: ' + str(type(status)))
-
-    def update_total_size(self, bytes_removed):
-        """Update the total size cleaned (status bar)."""
-        self.total_label.setText(bytes_to_human(bytes_removed))
+        if self._pending_total is not None:
+            self.total_label.setText(bytes_to_human(self._pending_total))
+            self._pending_total = None
 
     def update_item_size(self, operation, option_id, bytes_removed):
         """
@@ -631,32 +909,49 @@ class BleachBitQtMainWindow(QtWidgets.QMainWindow):
         if bytes_removed == 0:
             size_text = ""
 
-        top_count = self.tree.topLevelItemCount()
-        for i in range(top_count):
-            cleaner_item = self.tree.topLevelItem(i)
-            data = cleaner_item.data(0, QtCore.Qt.UserRole)
-            if not isinstance(data, dict):
-                continue
-            if data.get("type") != "cleaner":
-                continue
-            if data.get("id") != operation:
-                continue
-
-            if option_id == -1:
+        cleaner_item = self._cleaner_items.get(operation)
+        if cleaner_item is None:
+            return
+
+        # Don't update rows the user cannot see; stash the text and
+        # apply it when the cleaner is expanded.
+        if option_id != -1 and not cleaner_item.isExpanded():
+            self._pending_sizes.setdefault(operation, {})[option_id] = size_text
+            return
+
+        # Worker sends many identical (often zero-size) updates during
+        # preview; skip the no-op writes so the model emits no signal.
+        if option_id == -1:
+            if cleaner_item.text(1) != size_text:
                 cleaner_item.setText(1, size_text)
-            else:
-                for j in range(cleaner_item.childCount()):
-                    child = cleaner_item.child(j)
-                    cdata = child.data(0, QtCore.Qt.UserRole)
-                    if isinstance(cdata, dict) and cdata.get("id") == option_id:
-                        child.setText(1, size_text)
-                        break
-            break
+        else:
+            opt_item = self._option_items[operation].get(option_id)
+            if opt_item is not None and opt_item.text(1) != size_text:
+                opt_item.setText(1, size_text)
+
+    def _on_tree_item_expanded(self, item):
+        """Apply size texts deferred while the cleaner was collapsed."""
+        data = item.data(0, QtCore.Qt.UserRole)
+        if not isinstance(data, dict) or data.get("type") != "cleaner":
+            return
+        cleaner_id = data.get("id")
+        pending = self._pending_sizes.pop(cleaner_id, None)
+        if not pending:
+            return
+        option_items = self._option_items.get(cleaner_id, {})
+        for option_id, size_text in pending.items():
+            opt_item = option_items.get(option_id)
+            if opt_item is not None and opt_item.text(1) != size_text:
+                opt_item.setText(1, size_text)
 
     def worker_done(self, worker, really_delete):
         """
         Called when the Worker is finished.
         """
+        self._progress_timer.stop()
+        self._flush_progress()
+        self._log_timer.stop()
+        self._flush_log()
         self.progressbar.setValue(100)
         self.progressbar.setFormat(_("Done."))
         self.set_sensitive(True)
@@ -681,7 +976,7 @@ class BleachBitQtMainWindow(QtWidgets.QMainWindow):
 
     def cb_refresh_operations(self):
         """Refresh cleaners list after preference changes (e.g. auto_hide, language)."""
-        self._populate_cleaners_tree()
+        self._populate_cleaners_tree(rebuild=False)
 
     # ---------- misc ----------
 
@@ -706,6 +1001,20 @@ class BleachBitQtMainWindow(QtWidgets.QMainWindow):
                 logger.exception("Error aborting worker on exit")
         event.accept()
 
+_palette_cache = {}
+
+# Checkbox-indicator tweak for the dark palettes. Apply it once from
+# main_qt() when a non-default style is selected; it used to be set
+# inside get_style_palette() on every call.
+DARK_INDICATOR_STYLE_SHEET = """
+    QTreeView::indicator:unchecked,
+    QTreeWidget::indicator:unchecked {
+        border: 1px solid rgb(64,64,64);
+        background: rgb(0,0,0);
+    }
+"""
+
+
 def get_style_palette(app=None, style: str = "default") -> QPalette:
     """
     Return a QPalette for the given style. Example implementation for styles.
@@ -772,14 +1081,12 @@ def get_style_palette(app=None, style: str = "default") -> QPalette:
 
     if s == "default":
         return base_palette
-    
-    app.setStyleSheet("""
-        QTreeView::indicator:unchecked,
-        QTreeWidget::indicator:unchecked {
-            border: 1px solid rgb(64,64,64);
-            background: rgb(0,0,0);
-        }
-    """)
+
+    # The dark palettes never change within a run; return a copy of
+    # the memoized palette so callers cannot mutate the cache.
+    cached = _palette_cache.get(s)
+    if cached is not None:
+        return QPalette(cached)
 
     # Theme accents
     if s == "dark":
@@ -797,7 +1104,9 @@ def get_style_palette(app=None, style: str = "default") -> QPalette:
     else:
         return base_palette
 
-    return make_dark_palette(accent)
+    palette = make_dark_palette(accent)
+    _palette_cache[s] = QPalette(palette)
+    return palette
 
 
 def main_qt(auto_exit = False):
@@ -807,7 +1116,9 @@ def main_qt(auto_exit = False):
 
     app = QtWidgets.QApplication(sys.argv)
     app.setStyle('Fusion')
-    # An example how to set the optional theme: app.setPalette(get_a_style_palette(app, 'orange'))
+    # An example how to set the optional theme:
+    #   app.setPalette(get_style_palette(app, 'orange'))
+    #   app.setStyleSheet(DARK_INDICATOR_STYLE_SHEET)
     app.setPalette(get_style_palette(app))
     app.setApplicationName(APP_NAME)
     if appicon_path and os.path.exists(appicon_path):
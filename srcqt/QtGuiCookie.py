@@ -18,6 +18,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import functools
 import logging
 import os
 import sys
@@ -38,8 +39,17 @@ from bleachbit.Language import (
 
 from bleachbit.Options import options
 
+try:
+    import ijson  # optional; used to stream-parse large allowlists
+except ImportError:
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+# Allowlists larger than this are parsed with ijson (when available)
+# so the whole document is never materialized in memory.
+_STREAM_PARSE_THRESHOLD = 1 << 20  # bytes
+
 # Location types for preferences tabs
 LOCATIONS_WHITELIST = 1
 LOCATIONS_CUSTOM = 2
@@ -47,6 +57,248 @@ LOCATIONS_CUSTOM = 2
 COOKIE_ALLOWLIST_FILENAME = "cookie_allowlist.json"
 COOKIE_DISCOVERY_WARN_THRESHOLD = 2.0  # seconds
 
+# Cookie discovery walks browser profiles (SQLite databases) on disk;
+# cache the result briefly so reopening the dialog is instant.
+_discovery_cache = None  # (monotonic timestamp, list of hosts)
+_DISCOVERY_CACHE_TTL = 30.0  # seconds
+
+
+def _normalize_host(host):
+    """Return the canonical form of a cookie host: surrounding
+    whitespace and any leading dot removed.
+
+    The result is interned so the saved-domain set, the model and any
+    later discovery pass share one string object per host; membership
+    tests then hit the identity fast path."""
+    return sys.intern(host.strip().lstrip("."))
+
+
+@functools.lru_cache(maxsize=64)
+def _cookie_label_template(n):
+    """Return the stats label template for count n, caching the gettext
+    plural-forms lookup that would otherwise run per keystroke.
+
+    Keyed on the actual count because some locales have more than two
+    plural categories."""
+    return _n(
+        "%(selected)d of %(total)d cookie allowed",
+        "%(selected)d of %(total)d cookies allowed",
+        n,
+    )
+
+
+def _discover_cookie_hosts(force=False):
+    """Return the discovered cookie hosts, served from a short-lived
+    module cache unless force is True."""
+    global _discovery_cache
+    now = time.monotonic()
+    if (not force and _discovery_cache is not None
+            and now - _discovery_cache[0] < _DISCOVERY_CACHE_TTL):
+        return _discovery_cache[1]
+
+    start = time.monotonic()
+    discovered = []
+    try:
+        discovered = list_unique_cookies()
+    except (OSError, RuntimeError, ValueError) as exc:
+        logger.error("Failed to enumerate cookies: %s", exc)
+    duration = time.monotonic() - start
+    if duration >= COOKIE_DISCOVERY_WARN_THRESHOLD:
+        logger.warning("Enumerating cookie hosts took %.2fs", duration)
+
+    _discovery_cache = (time.monotonic(), discovered)
+    return discovered
+
+
+class _DiscoveryWorker(QtCore.QObject, QtCore.QRunnable):
+    """
+    Runs cookie discovery on the global thread pool so the dialog can
+    show immediately; the hosts are reported back through a queued
+    signal.
+    """
+
+    finished = QtCore.Signal(list)
+
+    def __init__(self, force=False):
+        QtCore.QObject.__init__(self)
+        QtCore.QRunnable.__init__(self)
+        self.setAutoDelete(True)
+        self._force = force
+
+    def run(self):
+        self.finished.emit(_discover_cookie_hosts(force=self._force))
+
+
+class CookieModel(QtCore.QAbstractTableModel):
+    """
+    Flat model of cookie hosts backed by a plain list of strings and a
+    set of checked row indices. Column 0 is the checkable Allow column,
+    column 1 the host. The view only queries data() for visible rows,
+    so populating thousands of hosts costs one model reset instead of
+    one QTreeWidgetItem construction per host.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hosts = []       # list[str]
+        self.hosts_lc = []    # lowercase parallel list for filtering
+        self.checked = set()  # set of row indices into self.hosts
+
+    def set_hosts(self, hosts, checked, hosts_lc=None):
+        """Replace the backing data in one model reset.
+
+        hosts_lc is the lowercase form of hosts; pass it when the
+        caller already computed it (e.g. as sort keys).
+        """
+        self.beginResetModel()
+        self.hosts = hosts
+        self.hosts_lc = (hosts_lc if hosts_lc is not None
+                         else [h.lower() for h in hosts])
+        self.checked = checked
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.hosts)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 2
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if (orientation == QtCore.Qt.Horizontal
+                and role == QtCore.Qt.DisplayRole):
+            return (_("Allow"), _("Host"))[section]
+        return None
+
+    def flags(self, index):
+        if index.column() == 0:
+            return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsUserCheckable
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        row = index.row()
+        if index.column() == 0:
+            if role == QtCore.Qt.CheckStateRole:
+                return (QtCore.Qt.Checked if row in self.checked
+                        else QtCore.Qt.Unchecked)
+        elif role == QtCore.Qt.DisplayRole:
+            return self.hosts[row]
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if role != QtCore.Qt.CheckStateRole or index.column() != 0:
+            return False
+        row = index.row()
+        checked = QtCore.Qt.CheckState(value) == QtCore.Qt.Checked
+        if checked == (row in self.checked):
+            return False
+        if checked:
+            self.checked.add(row)
+        else:
+            self.checked.discard(row)
+        self.dataChanged.emit(index, index, [QtCore.Qt.CheckStateRole])
+        return True
+
+    def set_rows_checked(self, rows, checked):
+        """Check or uncheck many rows with a single dataChanged emit."""
+        rows = [row for row in rows
+                if checked != (row in self.checked)]
+        if not rows:
+            return
+        if checked:
+            self.checked.update(rows)
+        else:
+            self.checked.difference_update(rows)
+        first, last = min(rows), max(rows)
+        self.dataChanged.emit(
+            self.index(first, 0), self.index(last, 0),
+            [QtCore.Qt.CheckStateRole])
+
+
+class CookieFilterProxyModel(QtCore.QSortFilterProxyModel):
+    """
+    Filters CookieModel rows in native code instead of a per-keystroke
+    Python loop over every host. Adds an optional 'only checked rows'
+    predicate on top of the case-insensitive host substring filter.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFilterKeyColumn(1)
+        self.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self._show_checked_only = False
+        self._query = ""
+        self._matches = None  # matching source rows; None means all
+        self._restricted = False  # _matches was built from checked rows only
+
+    def _rebuild_matches(self):
+        """Recompute the match set for the current query from scratch.
+
+        When 'show only allowed' is on, only checked rows can be
+        visible, so scan the (typically small) checked set instead of
+        every host."""
+        q = self._query
+        if not q:
+            self._matches = None
+            self._restricted = False
+            return
+        model = self.sourceModel()
+        # Hosts were lowercased once at populate time; no per-row
+        # str.lower() here.
+        hosts_lc = model.hosts_lc
+        if self._show_checked_only and len(model.checked) < len(hosts_lc):
+            candidates = model.checked
+            self._restricted = True
+        else:
+            candidates = range(len(hosts_lc))
+            self._restricted = False
+        self._matches = {i for i in candidates if q in hosts_lc[i]}
+
+    def set_query(self, text):
+        """Set the host substring filter, reusing the previous result
+        set when the new query merely extends the old one."""
+        q = text.strip().lower()
+        if q == self._query:
+            return
+        if (q and self._matches is not None
+                and q.startswith(self._query)):
+            # A longer prefix can only narrow the result, so re-test
+            # only the rows that matched the previous query.
+            hosts_lc = self.sourceModel().hosts_lc
+            self._matches = {i for i in self._matches if q in hosts_lc[i]}
+            self._query = q
+        else:
+            self._query = q
+            self._rebuild_matches()
+        self.invalidateFilter()
+
+    def reset_query_cache(self):
+        """Drop the cached result set (call after the source reset)."""
+        self._query = ""
+        self._matches = None
+        self._restricted = False
+
+    def set_show_checked_only(self, enabled):
+        enabled = bool(enabled)
+        if enabled == self._show_checked_only:
+            return
+        self._show_checked_only = enabled
+        if not enabled and self._restricted:
+            # The cached match set only covers checked rows; widen it
+            # back to the whole host list.
+            self._rebuild_matches()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._matches is not None and source_row not in self._matches:
+            return False
+        if (self._show_checked_only
+                and source_row not in self.sourceModel().checked):
+            return False
+        return True
+
+
 class QtCookieManagerDialog(QtWidgets.QDialog):
     """Manage cookies to keep (Qt port of GuiCookie.CookieManagerDialog)."""
 
@@ -61,6 +313,8 @@ class QtCookieManagerDialog(QtWidgets.QDialog):
         )
         self.saved_domains = self._load_saved_domains()
         self.show_selected_only = False
+        self._discovery_running = False
+        self._updates_scheduled = False
 
         self._build_ui()
         self._populate_cookie_list()
@@ -97,14 +351,20 @@ class QtCookieManagerDialog(QtWidgets.QDialog):
         top_row.addWidget(self.cb_show_selected)
         layout.addLayout(top_row)
 
-        # Tree of cookies: [Allow] [Host]
-        self.tree = QtWidgets.QTreeWidget()
-        self.tree.setColumnCount(2)
-        self.tree.setHeaderLabels([_("Allow"), _("Host")])
+        # View of cookies: [Allow] [Host], backed by CookieModel
+        # behind a filtering proxy
+        self.model = CookieModel(self)
+        self.model.dataChanged.connect(self._on_model_data_changed)
+        self.proxy = CookieFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+
+        self.tree = QtWidgets.QTreeView()
+        self.tree.setModel(self.proxy)
+        self.tree.setRootIsDecorated(False)
+        self.tree.setUniformRowHeights(True)
         header = self.tree.header()
         header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
-        self.tree.itemChanged.connect(self._on_item_changed)
         layout.addWidget(self.tree, 1)
 
         # Stats label
@@ -121,6 +381,12 @@ class QtCookieManagerDialog(QtWidgets.QDialog):
 
         btn_row.addWidget(self.btn_select_all)
         btn_row.addWidget(self.btn_select_none)
+
+        # Re-scan browser profiles, bypassing the discovery cache
+        self.btn_refresh = QtWidgets.QPushButton(_("Refresh"))
+        self.btn_refresh.clicked.connect(self._on_refresh_clicked)
+        btn_row.addWidget(self.btn_refresh)
+
         btn_row.addStretch(1)
 
         self.btn_cancel = QtWidgets.QPushButton(_("Cancel"))
@@ -137,78 +403,132 @@ class QtCookieManagerDialog(QtWidgets.QDialog):
     def _load_saved_domains(self):
         """Load saved cookie hostnames from cookie_allowlist.json."""
         domains = set()
+
+        if ijson is not None:
+            try:
+                large = (os.path.getsize(self.allowlist_path)
+                         > _STREAM_PARSE_THRESHOLD)
+            except OSError:
+                return domains
+            if large:
+                # Stream items out of the document instead of building
+                # a throwaway multi-MB list of Python objects.
+                try:
+                    with open(self.allowlist_path, "rb") as f:
+                        for item in ijson.items(f, "item"):
+                            if isinstance(item, dict):
+                                item = item.get("domain")
+                            if isinstance(item, str):
+                                host = _normalize_host(item)
+                                if host:
+                                    domains.add(host)
+                except (OSError, ijson.JSONError):
+                    pass
+                return domains
+
         try:
             with open(self.allowlist_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError, OSError):
             return domains
 
-        if isinstance(data, list):
+        if not (isinstance(data, list) and data):
+            return domains
+
+        # Allowlists are homogeneous in practice (list of strings, or
+        # the legacy list of dicts); sniff the first element and run a
+        # single specialized comprehension instead of discriminating
+        # each item in a Python loop.
+        first = data[0]
+        if isinstance(first, str) and all(isinstance(s, str) for s in data):
+            domains = {_normalize_host(s) for s in data}
+        elif isinstance(first, dict) and all(isinstance(d, dict) for d in data):
+            domains = {
+                _normalize_host(d["domain"]) for d in data
+                if isinstance(d.get("domain"), str)
+            }
+        else:
+            # Mixed list: keep the per-item discriminator.
             for item in data:
+                if isinstance(item, dict):
+                    item = item.get("domain")
                 if isinstance(item, str):
-                    candidate = item
-                elif isinstance(item, dict):
-                    candidate = item.get("domain")
-                else:
-                    candidate = None
-                if isinstance(candidate, str) and candidate:
-                    domains.add(candidate.strip())
+                    domains.add(_normalize_host(item))
+        domains.discard("")
         return domains
 
-    def _populate_cookie_list(self):
-        """Discover cookies, merge with saved domains, and fill the tree."""
-        start = time.monotonic()
-        discovered = []
+    def _populate_cookie_list(self, force_discovery=False):
+        """Start cookie discovery on the thread pool; the model is
+        filled by _on_discovery_done when the hosts come back."""
+        if self._discovery_running:
+            return
+        self._discovery_running = True
+        self.stat_label.setText(_("Looking for cookies…"))
+        worker = _DiscoveryWorker(force=force_discovery)
+        worker.finished.connect(self._on_discovery_done)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_discovery_done(self, discovered):
+        """Merge discovered hosts with saved domains and fill the model."""
+        self._discovery_running = False
+
+        # Canonicalize each host once here; downstream filter and save
+        # paths can then rely on the stored form as-is.
+        all_hosts = {_normalize_host(h) for h in discovered if h}
+        all_hosts |= self.saved_domains
+        all_hosts.discard("")
+        # Decorate-sort-undecorate: lowercase each host once instead of
+        # once per comparison, and reuse the lowercase column as the
+        # model's filter cache.
+        decorated = sorted((h.lower(), h) for h in all_hosts)
+        sorted_hosts = [h for _lc, h in decorated]
+        hosts_lc = [lc for lc, _h in decorated]
+
+        checked = {
+            i for i, host in enumerate(sorted_hosts)
+            if host in self.saved_domains
+        }
+        # One model reset; suspend view painting so the header and
+        # viewport settle in a single update.
+        self.tree.setUpdatesEnabled(False)
         try:
-            discovered = list_unique_cookies()
-        except (OSError, RuntimeError, ValueError) as exc:
-            logger.error("Failed to enumerate cookies: %s", exc)
-        duration = time.monotonic() - start
-        if duration >= COOKIE_DISCOVERY_WARN_THRESHOLD:
-            logger.warning("Enumerating cookie hosts took %.2fs", duration)
-
-        all_hosts = {h.strip() for h in discovered if h}
-        all_hosts.update(self.saved_domains)
-        sorted_hosts = sorted(all_hosts, key=lambda host: host.lower())
-
-        self.tree.blockSignals(True)
-        self.tree.clear()
-        for host in sorted_hosts:
-            if not host:
-                continue
-            item = QtWidgets.QTreeWidgetItem()
-            item.setFlags(
-                item.flags() | QtCore.Qt.ItemIsUserCheckable
-            )
-            item.setText(1, host)
-            if host in self.saved_domains:
-                item.setCheckState(0, QtCore.Qt.Checked)
-            else:
-                item.setCheckState(0, QtCore.Qt.Unchecked)
-            self.tree.addTopLevelItem(item)
-        self.tree.blockSignals(False)
+            self.model.set_hosts(sorted_hosts, checked, hosts_lc)
+            self.proxy.reset_query_cache()
+        finally:
+            self.tree.setUpdatesEnabled(True)
 
         self._update_stats()
         self._update_filter()
 
     def _iter_selected_domains(self):
-        """Yield domains currently marked as allowed."""
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            if item.checkState(0) == QtCore.Qt.Checked:
-                host = (item.text(1) or "").strip()
-                if host:
-                    # Normalize a little (strip leading dot)
-                    yield host.lstrip(".")
+        """Yield domains currently marked as allowed.
+
+        Hosts were normalized before entering the model, so no per-item
+        cleanup is needed here."""
+        for i in sorted(self.model.checked):
+            yield self.model.hosts[i]
 
     def accept(self):
         """Save whitelist and close dialog."""
-        whitelist = sorted(set(self._iter_selected_domains()))
+        new_domains = set(self._iter_selected_domains())
+        if new_domains == self.saved_domains:
+            # No change; skip the disk write entirely.
+            super().accept()
+            return
+
+        whitelist = sorted(new_domains)
+        tmp_path = self.allowlist_path + ".tmp"
         try:
             # Write as list of strings. BleachBit core also supports
             # legacy list-of-dicts, but strings are enough.
-            with open(self.allowlist_path, "w", encoding="utf-8") as f:
-                json.dump(whitelist, f, ensure_ascii=False, indent=2)
+            # Serialize first and write in one call; json.dump() issues
+            # many small writes through the file object. Write to a
+            # temp file and rename so a crash mid-write cannot corrupt
+            # the allowlist.
+            payload = json.dumps(whitelist, ensure_ascii=False, indent=2)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, self.allowlist_path)
         except OSError as exc:
             logger.error("Failed to save cookie allowlist: %s", exc)
             QtWidgets.QMessageBox.critical(
@@ -218,69 +538,61 @@ class QtCookieManagerDialog(QtWidgets.QDialog):
             )
             return  # Do not close dialog on failure
 
-        self.saved_domains = set(whitelist)
+        self.saved_domains = new_domains
         super().accept()
 
     # ---------- Filter and stats ----------
 
+    def _visible_rows(self):
+        """Return the list of source rows currently shown in the view."""
+        return [
+            self.proxy.mapToSource(self.proxy.index(row, 0)).row()
+            for row in range(self.proxy.rowCount())
+        ]
+
     def _update_filter(self):
         """Apply text filter and 'show only allowed' filter."""
-        search_text = self.search_entry.text().strip().lower()
-        show_selected_only = self.show_selected_only
-
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            domain = (item.text(1) or "").lower()
-            matches_search = not search_text or (search_text in domain)
-            matches_selected = True
-            if show_selected_only:
-                matches_selected = item.checkState(0) == QtCore.Qt.Checked
-
-            item.setHidden(not (matches_search and matches_selected))
-
+        self.proxy.set_query(self.search_entry.text())
         self._update_stats()
 
     def _update_stats(self):
         """Update the 'X of Y cookies allowed' label."""
-        total = self.tree.topLevelItemCount()
-        selected = 0
-        for i in range(total):
-            item = self.tree.topLevelItem(i)
-            if item.checkState(0) == QtCore.Qt.Checked:
-                selected += 1
+        total = len(self.model.hosts)
+        selected = len(self.model.checked)
 
         self.stat_label.setText(
-            _n(
-                "%(selected)d of %(total)d cookie allowed",
-                "%(selected)d of %(total)d cookies allowed",
-                selected,
-            )
+            _cookie_label_template(selected)
             % {"selected": selected, "total": total}
         )
 
     # ---------- Callbacks ----------
 
-    def _on_item_changed(self, _item, _column):
-        # Any checkbox change updates stats and filter when needed
+    def _on_model_data_changed(self, _top_left, _bottom_right, _roles=None):
+        # Coalesce bursts of change notifications into a single
+        # stats/filter pass on the next event-loop turn.
+        if self._updates_scheduled:
+            return
+        self._updates_scheduled = True
+        QtCore.QTimer.singleShot(0, self._flush_updates)
+
+    def _flush_updates(self):
+        self._updates_scheduled = False
         self._update_stats()
         if self.show_selected_only:
-            self._update_filter()
+            self.proxy.invalidateFilter()
+
+    def _on_refresh_clicked(self):
+        self._populate_cookie_list(force_discovery=True)
 
     def _on_show_selected_toggled(self, checked):
         self.show_selected_only = bool(checked)
-        self._update_filter()
+        self.proxy.set_show_checked_only(checked)
+        self._update_stats()
 
     def _select_all_visible(self):
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            if not item.isHidden():
-                item.setCheckState(0, QtCore.Qt.Checked)
-        self._update_stats()
+        # set_rows_checked emits one dataChanged, which schedules the
+        # coalesced stats/filter update
+        self.model.set_rows_checked(self._visible_rows(), True)
 
     def _select_none_visible(self):
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            if not item.isHidden():
-                item.setCheckState(0, QtCore.Qt.Unchecked)
-        self._update_stats()
-
+        self.model.set_rows_checked(self._visible_rows(), False)
@@ -18,30 +18,23 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import bisect
+import functools
 import logging
 import os
-import sys
-import time
-import json   # NEW
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
-import bleachbit
-from bleachbit import APP_NAME, appicon_path, online_update_notification_enabled
-from bleachbit.Cleaner import backends, register_cleaners
-from bleachbit.Cookie import list_unique_cookies  # NEW
+from bleachbit import online_update_notification_enabled
 from bleachbit.Language import (
     get_text as _,
     pget_text as _p,
-    nget_text as _n,              # NEW
     get_active_language_code,
     get_supported_language_code_name_dict,
     setup_translation,
 )
 
 from bleachbit.Options import options
-from bleachbit.FileUtilities import bytes_to_human
-from bleachbit.Log import GtkLoggerHandler, set_root_log_level
 
 from bleachbit.QtGuiCookie import QtCookieManagerDialog
 
@@ -51,13 +44,65 @@ logger = logging.getLogger(__name__)
 LOCATIONS_WHITELIST = 1
 LOCATIONS_CUSTOM = 2
 
-COOKIE_ALLOWLIST_FILENAME = "cookie_allowlist.json"
-COOKIE_DISCOVERY_WARN_THRESHOLD = 2.0  # seconds
+# Memoized gettext lookups for strings requested repeatedly during
+# page (re)builds; cleared by _retranslate() on UI language change.
+_tr = functools.lru_cache(maxsize=None)(_)
+_trp = functools.lru_cache(maxsize=None)(_p)
+
+# Translated strings used repeatedly (per tree row or per page build);
+# filled lazily by _retranslate() and refreshed on UI language change.
+_TR = {}
+
+
+def _retranslate():
+    _tr.cache_clear()
+    _trp.cache_clear()
+    _TR.update({
+        'file': _('File'),
+        'folder': _('Folder'),
+        'add_file': _p('button', 'Add file'),
+        'add_folder': _p('button', 'Add folder'),
+        'remove': _p('button', 'Remove'),
+    })
+
+
+@functools.lru_cache(maxsize=1)
+def _sorted_languages():
+    """Return supported languages as (code, name) tuples sorted by
+    display name. The locale table does not change at runtime, so
+    compute it once and share it between the language combo and the
+    preserve-languages table."""
+    try:
+        supported = get_supported_language_code_name_dict().items()
+    except Exception:
+        logger.error("Failed to get supported languages", exc_info=True)
+        return []
+    return sorted(supported, key=lambda cn: (cn[1] or cn[0]).casefold())
+
 
 # ---------------------------------------------------------------------------
 # Qt Preferences dialog
 # ---------------------------------------------------------------------------
 
+# Shared dialog instance; see show_preferences_dialog()
+_dialog = None
+
+
+def show_preferences_dialog(parent=None, cb_refresh_operations=None):
+    """Show the preferences dialog, reusing one instance across opens.
+
+    Constructing the dialog (tabs, language table, locations trees) is
+    the dominant cost of opening it; the widget tree survives between
+    opens and showEvent re-syncs checkbox state from options."""
+    global _dialog
+    if _dialog is None:
+        _dialog = QtPreferencesDialog(
+            parent, cb_refresh_operations=cb_refresh_operations)
+    else:
+        _dialog.cb_refresh_operations = cb_refresh_operations
+    _dialog.exec()
+
+
 class QtPreferencesDialog(QtWidgets.QDialog):
     """ 
     Qt implementation (Qt/PySide6) of the BleachBit Preferences dialog 
@@ -67,7 +112,9 @@ class QtPreferencesDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self.cb_refresh_operations = cb_refresh_operations
         self.refresh_operations = False
-        self._languages_table_populating = False
+        # Boolean option changes are buffered here and written out
+        # only when the dialog is accepted; Cancel discards them.
+        self._pending_opts = {}
 
         self.setWindowTitle(_("Preferences"))
         self.resize(650, 500)
@@ -75,6 +122,39 @@ class QtPreferencesDialog(QtWidgets.QDialog):
 
         self._build_ui()
 
+    def showEvent(self, event):
+        """Re-sync widget state from options when the reused dialog is
+        shown again; the widget tree itself is not rebuilt."""
+        self.refresh_operations = False
+        self._pending_opts.clear()
+        self._sync_from_options()
+        super().showEvent(event)
+
+    def _sync_from_options(self):
+        # Generic boolean checkboxes carry their option key as the
+        # bb_option property; signals are blocked so syncing does not
+        # write the same values straight back.
+        for cb in self.findChildren(QtWidgets.QCheckBox):
+            key = cb.property("bb_option")
+            if not key:
+                continue
+            blocker = QtCore.QSignalBlocker(cb)
+            cb.setChecked(bool(options.get(key)))
+            del blocker
+        if hasattr(self, 'cb_auto_lang'):
+            is_auto_detect = bool(options.get('auto_detect_lang'))
+            blocker = QtCore.QSignalBlocker(self.cb_auto_lang)
+            self.cb_auto_lang.setChecked(is_auto_detect)
+            del blocker
+            self._set_language_widgets_enabled(not is_auto_detect)
+        # Restore the enabled states that _set_option drives as side
+        # effects; setChecked alone does not recompute them.
+        if hasattr(self, 'cb_updates'):
+            enabled = bool(options.get('check_online_updates'))
+            self.cb_beta.setEnabled(enabled)
+            if self.cb_winapp2 is not None:
+                self.cb_winapp2.setEnabled(enabled)
+
     # ---------- UI construction ----------
 
     def _build_ui(self):
@@ -83,14 +163,32 @@ class QtPreferencesDialog(QtWidgets.QDialog):
         self.tabs = QtWidgets.QTabWidget()
         layout.addWidget(self.tabs)
 
+        # Sets of known paths for O(1) duplicate checks on add;
+        # maintained by _add_path_qt / _remove_path_qt.
+        self._whitelist_set = {
+            p for ptype, p in (options.get_whitelist_paths() or [])}
+        self._custom_set = {
+            p for ptype, p in (options.get_custom_paths() or [])}
+        self._known_paths = self._whitelist_set | self._custom_set
+
         # Order mirrors GTK:
         # General, Custom, Drives, (Languages on POSIX), Allowlist
-        self.tabs.addTab(self._build_general_page(), _("General"))
-        self.tabs.addTab(self._build_locations_page(LOCATIONS_CUSTOM), _("Custom"))
-        self.tabs.addTab(self._build_drives_page(), _("Drives"))
+        # Pages are built lazily: each tab starts as an empty
+        # placeholder that is swapped for the real page the first time
+        # the user selects it, so opening the dialog does not pay for
+        # the languages table or the locations trees up front.
+        self._tab_builders = {}
+        self._add_lazy_tab(self._build_general_page, _("General"))
+        self._add_lazy_tab(
+            lambda: self._build_locations_page(LOCATIONS_CUSTOM), _("Custom"))
+        self._add_lazy_tab(self._build_drives_page, _("Drives"))
         if os.name == 'posix':
-            self.tabs.addTab(self._build_languages_page(), _("Languages"))
-        self.tabs.addTab(self._build_locations_page(LOCATIONS_WHITELIST), _("Allowlist"))
+            self._add_lazy_tab(self._build_languages_page, _("Languages"))
+        self._add_lazy_tab(
+            lambda: self._build_locations_page(LOCATIONS_WHITELIST),
+            _("Allowlist"))
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(0)
 
         # Button box
         button_box = QtWidgets.QDialogButtonBox(
@@ -100,30 +198,64 @@ class QtPreferencesDialog(QtWidgets.QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+    def _add_lazy_tab(self, builder, label):
+        """Add a placeholder tab whose page is built on first view."""
+        index = self.tabs.addTab(QtWidgets.QWidget(), label)
+        self._tab_builders[index] = builder
+
+    def _ensure_tab_built(self, index):
+        """Replace the placeholder at index with the real page."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        label = self.tabs.tabText(index)
+        placeholder = self.tabs.widget(index)
+        # removeTab() on the current tab re-emits currentChanged for
+        # the neighboring placeholder, which would recursively build
+        # the rest of the tabs; block signals around the swap.
+        blocker = QtCore.QSignalBlocker(self.tabs)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, builder(), label)
+        self.tabs.setCurrentIndex(index)
+        del blocker
+        placeholder.deleteLater()
+
     # ---------- General page ----------
 
     def _build_general_page(self):
         widget = QtWidgets.QWidget()
         vbox = QtWidgets.QVBoxLayout(widget)
 
-        self._create_update_widgets(vbox)
-        self._create_general_checkboxes(vbox)
+        # One pass through the config instead of one options.get per
+        # checkbox below.
+        keys = ['check_online_updates', 'check_beta', 'auto_hide', 'shred',
+                'exit_done', 'delete_confirmation', 'units_iec',
+                'remember_geometry', 'auto_detect_lang']
+        if os.name == 'nt':
+            keys.append('update_winapp2')
+        opts = self._snapshot_options(keys)
+
+        self._create_update_widgets(vbox, opts)
+        self._create_general_checkboxes(vbox, opts)
 
         # Remember window geometry
         self.cb_geom = QtWidgets.QCheckBox(_("Remember window geometry"))
-        self.cb_geom.setChecked(options.get("remember_geometry"))
-        self.cb_geom.toggled.connect(
-            lambda checked: self._set_option("remember_geometry", checked)
-        )
+        self.cb_geom.setChecked(opts["remember_geometry"])
+        self.cb_geom.setProperty("bb_option", "remember_geometry")
+        self.cb_geom.toggled.connect(self._on_generic_toggled)
         vbox.addWidget(self.cb_geom)
 
         # Language selection widgets (UI language)
-        self._create_language_widgets(vbox)
+        self._create_language_widgets(vbox, opts)
 
         vbox.addStretch(1)
         return widget
 
-    def _create_update_widgets(self, vbox):
+    def _snapshot_options(self, keys):
+        """Read several boolean options in one pass."""
+        return {k: options.get(k) for k in keys}
+
+    def _create_update_widgets(self, vbox, opts):
         """Create and configure update-related checkboxes."""
         if not online_update_notification_enabled:
             return
@@ -131,7 +263,7 @@ class QtPreferencesDialog(QtWidgets.QDialog):
         self.cb_updates = QtWidgets.QCheckBox(
             _("Check periodically for software updates via the Internet")
         )
-        self.cb_updates.setChecked(options.get('check_online_updates'))
+        self.cb_updates.setChecked(opts['check_online_updates'])
         self.cb_updates.setToolTip(
             _(
                 "If an update is found, you will be given the option to "
@@ -139,100 +271,94 @@ class QtPreferencesDialog(QtWidgets.QDialog):
                 "and install the update."
             )
         )
-        self.cb_updates.toggled.connect(self._on_updates_toggled)
+        self.cb_updates.setProperty("bb_option", "check_online_updates")
+        self.cb_updates.toggled.connect(self._on_generic_toggled)
         vbox.addWidget(self.cb_updates)
 
         updates_group = QtWidgets.QGroupBox(_("Software updates"))
         gbox = QtWidgets.QVBoxLayout(updates_group)
 
         self.cb_beta = QtWidgets.QCheckBox(_("Check for new beta releases"))
-        self.cb_beta.setChecked(options.get('check_beta'))
-        self.cb_beta.setEnabled(options.get('check_online_updates'))
-        self.cb_beta.toggled.connect(
-            lambda checked: self._set_option('check_beta', checked)
-        )
+        self.cb_beta.setChecked(opts['check_beta'])
+        self.cb_beta.setEnabled(opts['check_online_updates'])
+        self.cb_beta.setProperty("bb_option", "check_beta")
+        self.cb_beta.toggled.connect(self._on_generic_toggled)
         gbox.addWidget(self.cb_beta)
 
         if os.name == 'nt':
             self.cb_winapp2 = QtWidgets.QCheckBox(
                 _("Download and update cleaners from community (winapp2.ini)")
             )
-            self.cb_winapp2.setChecked(options.get('update_winapp2'))
-            self.cb_winapp2.setEnabled(options.get('check_online_updates'))
-            self.cb_winapp2.toggled.connect(
-                lambda checked: self._set_option('update_winapp2', checked)
-            )
+            self.cb_winapp2.setChecked(opts['update_winapp2'])
+            self.cb_winapp2.setEnabled(opts['check_online_updates'])
+            self.cb_winapp2.setProperty("bb_option", "update_winapp2")
+            self.cb_winapp2.toggled.connect(self._on_generic_toggled)
             gbox.addWidget(self.cb_winapp2)
         else:
             self.cb_winapp2 = None
 
         vbox.addWidget(updates_group)
 
-    def _create_general_checkboxes(self, vbox):
+    def _create_general_checkboxes(self, vbox, opts):
         """Create and configure general checkboxes."""
 
         # Hide irrelevant cleaners
         cb_auto_hide = QtWidgets.QCheckBox(_("Hide irrelevant cleaners"))
-        cb_auto_hide.setChecked(options.get('auto_hide'))
+        cb_auto_hide.setChecked(opts['auto_hide'])
         cb_auto_hide.setToolTip(
             _(
                 "Hide cleaners which would do nothing on this system "
                 "(for example, Firefox if it is not installed)."
             )
         )
-        cb_auto_hide.toggled.connect(
-            lambda checked: self._on_auto_hide_toggled(checked)
-        )
+        cb_auto_hide.setProperty("bb_option", "auto_hide")
+        cb_auto_hide.toggled.connect(self._on_generic_toggled)
         vbox.addWidget(cb_auto_hide)
 
         # Overwrite contents (shred)
         cb_shred = QtWidgets.QCheckBox(
             _("Overwrite contents of files to prevent recovery")
         )
-        cb_shred.setChecked(options.get('shred'))
+        cb_shred.setChecked(opts['shred'])
         cb_shred.setToolTip(
             _(
                 "Overwriting is ineffective on some file systems and some "
                 "BleachBit operations. Overwriting is significantly slower."
             )
         )
-        cb_shred.toggled.connect(
-            lambda checked: self._set_option('shred', checked)
-        )
+        cb_shred.setProperty("bb_option", "shred")
+        cb_shred.toggled.connect(self._on_generic_toggled)
         vbox.addWidget(cb_shred)
 
         # Exit after cleaning
         cb_exit = QtWidgets.QCheckBox(_("Exit after cleaning"))
-        cb_exit.setChecked(options.get('exit_done'))
-        cb_exit.toggled.connect(
-            lambda checked: self._set_option('exit_done', checked)
-        )
+        cb_exit.setChecked(opts['exit_done'])
+        cb_exit.setProperty("bb_option", "exit_done")
+        cb_exit.toggled.connect(self._on_generic_toggled)
         vbox.addWidget(cb_exit)
 
         # Confirm before delete
         cb_popup = QtWidgets.QCheckBox(_("Confirm before delete"))
-        cb_popup.setChecked(options.get('delete_confirmation'))
-        cb_popup.toggled.connect(
-            lambda checked: self._set_option('delete_confirmation', checked)
-        )
+        cb_popup.setChecked(opts['delete_confirmation'])
+        cb_popup.setProperty("bb_option", "delete_confirmation")
+        cb_popup.toggled.connect(self._on_generic_toggled)
         vbox.addWidget(cb_popup)
 
         # IEC sizes
         cb_units_iec = QtWidgets.QCheckBox(
             _("Use IEC sizes (1 KiB = 1024 bytes) instead of SI (1 kB = 1000 bytes)")
         )
-        cb_units_iec.setChecked(options.get("units_iec"))
-        cb_units_iec.toggled.connect(
-            lambda checked: self._set_option("units_iec", checked)
-        )
+        cb_units_iec.setChecked(opts["units_iec"])
+        cb_units_iec.setProperty("bb_option", "units_iec")
+        cb_units_iec.toggled.connect(self._on_generic_toggled)
         vbox.addWidget(cb_units_iec)
 
-    def _create_language_widgets(self, vbox):
+    def _create_language_widgets(self, vbox, opts):
         """Language auto-detection + UI language combo."""
         lang_box = QtWidgets.QVBoxLayout()
 
         self.cb_auto_lang = QtWidgets.QCheckBox(_("Auto-detect language"))
-        is_auto_detect = options.get("auto_detect_lang")
+        is_auto_detect = opts["auto_detect_lang"]
         self.cb_auto_lang.setChecked(is_auto_detect)
         self.cb_auto_lang.setToolTip(
             _("Automatically detect the system language")
@@ -247,28 +373,24 @@ class QtPreferencesDialog(QtWidgets.QDialog):
         self.lang_combo = QtWidgets.QComboBox()
         self.lang_select_box.addWidget(self.lang_combo, 1)
 
-        # Populate combobox
+        # Direct references for enable/disable; cheaper than walking
+        # the layout with itemAt() on every auto-detect toggle.
+        self._lang_widgets = (lang_label, self.lang_combo)
+
+        # Populate combobox: addItems inserts every row in one model
+        # change, then the codes are attached as userData.
         current_lang_code = get_active_language_code()
-        lang_idx = 0
-        active_language_idx = None
-        try:
-            supported_langs = get_supported_language_code_name_dict().items()
-        except Exception:
-            logger.error("Failed to get supported languages", exc_info=True)
-            supported_langs = []
-
-        for lang_code, native in sorted(
-            supported_langs, key=lambda x: x[1] or x[0]
-        ):
-            if native:
-                text = f"{native} ({lang_code})"
-            else:
-                text = lang_code
-            self.lang_combo.addItem(text, userData=lang_code)
-            if lang_code == current_lang_code:
-                active_language_idx = lang_idx
-            lang_idx += 1
+        langs = _sorted_languages()
+        self.lang_combo.addItems(
+            [f"{native} ({code})" if native else code
+             for code, native in langs]
+        )
+        for i, (code, _native) in enumerate(langs):
+            self.lang_combo.setItemData(i, code)
 
+        active_language_idx = next(
+            (i for i, (code, _native) in enumerate(langs)
+             if code == current_lang_code), None)
         if active_language_idx is not None:
             self.lang_combo.setCurrentIndex(active_language_idx)
 
@@ -319,39 +441,57 @@ class QtPreferencesDialog(QtWidgets.QDialog):
         return widget
 
     def _reload_drives_list(self):
-        self.drives_list.clear()
-        for path in self._shred_drives_paths:
-            self.drives_list.addItem(path)
+        # addItems inserts the whole list in one model change
+        self.drives_list.setUpdatesEnabled(False)
+        try:
+            self.drives_list.clear()
+            self.drives_list.addItems(self._shred_drives_paths)
+        finally:
+            self.drives_list.setUpdatesEnabled(True)
 
     def _add_drive(self):
         """Add a directory to the shred_drives list."""
-        caption = _("Choose a folder")
-        start_dir = os.path.expanduser("~")
-        dirname = QtWidgets.QFileDialog.getExistingDirectory(
-            self,
-            caption,
-            start_dir,
-            QtWidgets.QFileDialog.ShowDirsOnly
-        )
-        if dirname:
-            dirname = os.path.abspath(dirname)
-            if dirname not in self._shred_drives_paths:
-                self._shred_drives_paths.append(dirname)
-                self._shred_drives_paths.sort()
-                self._reload_drives_list()
-                options.set_list('shred_drives', self._shred_drives_paths)
+        # open() is non-modal: the event loop keeps running (the dialog
+        # stays repaintable) while the picker is up, unlike the
+        # blocking static getExistingDirectory.
+        dlg = QtWidgets.QFileDialog(
+            self, _("Choose a folder"), os.path.expanduser("~"))
+        dlg.setFileMode(QtWidgets.QFileDialog.Directory)
+        dlg.setOption(QtWidgets.QFileDialog.ShowDirsOnly, True)
+        dlg.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        dlg.fileSelected.connect(self._on_drive_chosen)
+        dlg.open()
+
+    def _on_drive_chosen(self, dirname):
+        if not dirname:
+            return
+        # Qt resolved this path for the dialog moments ago; reuse its
+        # cached answer instead of os.path.abspath (getcwd syscall, and
+        # possibly the network for UNC paths).
+        dirname = QtCore.QFileInfo(dirname).canonicalFilePath() or dirname
+        # The list is kept sorted, so one bisection finds both the
+        # duplicate (if any) and the insertion point; insert a single
+        # widget row instead of clearing and repopulating the list.
+        idx = bisect.bisect_left(self._shred_drives_paths, dirname)
+        if (idx < len(self._shred_drives_paths)
+                and self._shred_drives_paths[idx] == dirname):
+            return
+        self._shred_drives_paths.insert(idx, dirname)
+        self.drives_list.insertItem(idx, dirname)
+        options.set_list('shred_drives', self._shred_drives_paths)
 
     def _remove_drive(self):
         """Remove selected paths from shred_drives list."""
         selected = self.drives_list.selectedItems()
         if not selected:
             return
-        for item in selected:
-            path = item.text()
-            if path in self._shred_drives_paths:
-                self._shred_drives_paths.remove(path)
-        self._shred_drives_paths.sort()
-        self._reload_drives_list()
+        # Rows mirror _shred_drives_paths; remove back-to-front so the
+        # remaining indices stay valid.
+        rows = sorted((self.drives_list.row(item) for item in selected),
+                      reverse=True)
+        for row in rows:
+            self.drives_list.takeItem(row)
+            del self._shred_drives_paths[row]
         options.set_list('shred_drives', self._shred_drives_paths)
 
     # ---------- Languages page (preserve languages) ----------
@@ -366,64 +506,61 @@ class QtPreferencesDialog(QtWidgets.QDialog):
         notice.setWordWrap(True)
         vbox.addWidget(notice)
 
-        self.languages_table = QtWidgets.QTableWidget()
-        self.languages_table.setColumnCount(3)
-        self.languages_table.setHorizontalHeaderLabels(
-            [_("Preserve"), _("Code"), _("Name")]
-        )
-        header = self.languages_table.horizontalHeader()
-        header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QtWidgets.QHeaderView.Stretch)
-
-        # Populate rows
-        try:
-            supported = get_supported_language_code_name_dict().items()
-        except Exception:
-            logger.error("Failed to get languages for preserve list", exc_info=True)
-            supported = []
-
-        rows = []
-        for lang_code, native in supported:
-            preserve = options.get_language(lang_code)
-            rows.append((native or "", lang_code, preserve))
-        rows.sort(key=lambda x: x[0] or x[1])
-
-        self._languages_table_populating = True
-        self.languages_table.setRowCount(len(rows))
-        for row_idx, (native, lang_code, preserve) in enumerate(rows):
-            chk_item = QtWidgets.QTableWidgetItem()
-            chk_item.setFlags(
-                QtCore.Qt.ItemIsUserCheckable | QtCore.Qt.ItemIsEnabled
-            )
+        # Populate rows; _sorted_languages() is already in display order
+        rows = [
+            (native or "", lang_code, options.get_language(lang_code))
+            for lang_code, native in _sorted_languages()
+        ]
+
+        # QStandardItemModel + QTableView instead of QTableWidget:
+        # no per-cell widget item wrappers, and the model is filled
+        # column-wise in three structural inserts instead of 3N setItem
+        # calls. itemChanged is connected only after population.
+        chk_items = []
+        code_items = []
+        name_items = []
+        for native, lang_code, preserve in rows:
+            chk_item = QtGui.QStandardItem()
+            chk_item.setCheckable(True)
+            chk_item.setEditable(False)
             chk_item.setCheckState(
                 QtCore.Qt.Checked if preserve else QtCore.Qt.Unchecked
             )
-            self.languages_table.setItem(row_idx, 0, chk_item)
+            chk_items.append(chk_item)
 
-            code_item = QtWidgets.QTableWidgetItem(lang_code)
-            code_item.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable)
-            self.languages_table.setItem(row_idx, 1, code_item)
+            code_item = QtGui.QStandardItem(lang_code)
+            code_item.setEditable(False)
+            code_items.append(code_item)
 
-            name_item = QtWidgets.QTableWidgetItem(native)
-            name_item.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable)
-            self.languages_table.setItem(row_idx, 2, name_item)
+            name_item = QtGui.QStandardItem(native)
+            name_item.setEditable(False)
+            name_items.append(name_item)
 
-        self._languages_table_populating = False
-        self.languages_table.itemChanged.connect(
-            self._on_languages_table_item_changed
+        self.languages_model = QtGui.QStandardItemModel(0, 0, self)
+        self.languages_model.appendColumn(chk_items)
+        self.languages_model.appendColumn(code_items)
+        self.languages_model.appendColumn(name_items)
+        self.languages_model.setHorizontalHeaderLabels(
+            [_("Preserve"), _("Code"), _("Name")]
         )
+        self.languages_model.itemChanged.connect(
+            self._on_languages_model_item_changed
+        )
+
+        self.languages_view = QtWidgets.QTableView()
+        self.languages_view.setModel(self.languages_model)
+        header = self.languages_view.horizontalHeader()
+        header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(2, QtWidgets.QHeaderView.Stretch)
 
-        vbox.addWidget(self.languages_table)
+        vbox.addWidget(self.languages_view)
         return widget
 
-    def _on_languages_table_item_changed(self, item):
-        if self._languages_table_populating:
-            return
+    def _on_languages_model_item_changed(self, item):
         if item.column() != 0:
             return
-        row = item.row()
-        code_item = self.languages_table.item(row, 1)
+        code_item = self.languages_model.item(item.row(), 1)
         if not code_item:
             return
         langid = code_item.text()
@@ -440,6 +577,9 @@ class QtPreferencesDialog(QtWidgets.QDialog):
         widget = QtWidgets.QWidget()
         vbox = QtWidgets.QVBoxLayout(widget)
 
+        if not _TR:
+            _retranslate()
+
         # load data
         if page_type == LOCATIONS_WHITELIST:
             pathnames = options.get_whitelist_paths() or []
@@ -448,9 +588,9 @@ class QtPreferencesDialog(QtWidgets.QDialog):
 
         # Notice label
         if page_type == LOCATIONS_WHITELIST:
-            notice_text = _("These paths will not be deleted or modified.")
+            notice_text = _tr("These paths will not be deleted or modified.")
         else:
-            notice_text = _("These locations can be selected for deletion.")
+            notice_text = _tr("These locations can be selected for deletion.")
         notice = QtWidgets.QLabel(notice_text)
         font = QtGui.QFont()
         font.setBold(True)
@@ -461,7 +601,7 @@ class QtPreferencesDialog(QtWidgets.QDialog):
         # Optional cookie manager button for allowlist
         btn_cookie_mgr = None
         if page_type == LOCATIONS_WHITELIST:
-            btn_cookie_mgr = QtWidgets.QPushButton(_("Manage cookies to keep..."))
+            btn_cookie_mgr = QtWidgets.QPushButton(_tr("Manage cookies to keep..."))
             btn_cookie_mgr.setSizePolicy(
                 QtWidgets.QSizePolicy.Policy.Maximum,
                 QtWidgets.QSizePolicy.Policy.Fixed,
@@ -471,29 +611,37 @@ class QtPreferencesDialog(QtWidgets.QDialog):
         # Tree widget: 2 columns (Type, Path)
         tree = QtWidgets.QTreeWidget()
         tree.setColumnCount(2)
-        tree.setHeaderLabels([_("Type"), _("Path")])
+        tree.setHeaderLabels([_tr("Type"), _tr("Path")])
         tree.header().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)
         tree.header().setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
 
+        # Keep the loaded list on the tree so add/remove can mutate it
+        # in place instead of re-reading options on every click.
+        tree._backing_list = pathnames
+
+        items = []
         for type_code, path in pathnames:
-            if type_code == 'file':
-                type_str = _('File')
-            elif type_code == 'folder':
-                type_str = _('Folder')
-            else:
+            type_str = _TR.get(type_code)
+            if type_str is None:
                 # Shouldn't happen, but don't crash UI
                 logger.error("Invalid type code in locations list: %r", type_code)
                 continue
-            item = QtWidgets.QTreeWidgetItem([type_str, path])
-            tree.addTopLevelItem(item)
+            items.append(QtWidgets.QTreeWidgetItem([type_str, path]))
+
+        # One structural insert instead of one per row
+        tree.setUpdatesEnabled(False)
+        try:
+            tree.addTopLevelItems(items)
+        finally:
+            tree.setUpdatesEnabled(True)
 
         vbox.addWidget(tree, 1)
 
         # Buttons: Add file, Add folder, Remove
         btn_layout = QtWidgets.QHBoxLayout()
-        btn_add_file = QtWidgets.QPushButton(_p('button', 'Add file'))
-        btn_add_folder = QtWidgets.QPushButton(_p('button', 'Add folder'))
-        btn_remove = QtWidgets.QPushButton(_p('button', 'Remove'))
+        btn_add_file = QtWidgets.QPushButton(_TR['add_file'])
+        btn_add_folder = QtWidgets.QPushButton(_TR['add_folder'])
+        btn_remove = QtWidgets.QPushButton(_TR['remove'])
 
         btn_layout.addWidget(btn_add_file)
         btn_layout.addWidget(btn_add_folder)
@@ -503,31 +651,28 @@ class QtPreferencesDialog(QtWidgets.QDialog):
             btn_layout.addWidget(btn_cookie_mgr)
         vbox.addLayout(btn_layout)
 
-        # Wire up callbacks, capturing page_type and tree
+        # Wire up callbacks, capturing page_type and tree. File pickers
+        # use non-modal open() so the event loop keeps running.
         def add_file_cb():
-            caption = _("Choose a file")
-            start_dir = os.path.expanduser("~")
-            pathname, selectedFilter = QtWidgets.QFileDialog.getOpenFileName(
-                self, 
-                caption, 
-                start_dir
-            )
-            if pathname:
-                pathname = os.path.abspath(pathname)
-                self._add_path_qt(pathname, 'file', page_type, tree)
+            dlg = QtWidgets.QFileDialog(
+                self, _tr("Choose a file"), os.path.expanduser("~"))
+            dlg.setFileMode(QtWidgets.QFileDialog.ExistingFile)
+            dlg.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+            dlg.fileSelected.connect(
+                lambda pathname: self._on_location_chosen(
+                    pathname, 'file', page_type, tree))
+            dlg.open()
 
         def add_folder_cb():
-            caption = _("Choose a folder")
-            start_dir = os.path.expanduser("~")
-            dirname = QtWidgets.QFileDialog.getExistingDirectory(
-                self,
-                caption,
-                start_dir,
-                QtWidgets.QFileDialog.ShowDirsOnly
-            )
-            if dirname:
-                dirname = os.path.abspath(dirname)
-                self._add_path_qt(dirname, 'folder', page_type, tree)
+            dlg = QtWidgets.QFileDialog(
+                self, _tr("Choose a folder"), os.path.expanduser("~"))
+            dlg.setFileMode(QtWidgets.QFileDialog.Directory)
+            dlg.setOption(QtWidgets.QFileDialog.ShowDirsOnly, True)
+            dlg.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+            dlg.fileSelected.connect(
+                lambda dirname: self._on_location_chosen(
+                    dirname, 'folder', page_type, tree))
+            dlg.open()
 
         def remove_cb():
             self._remove_path_qt(tree, page_type)
@@ -538,39 +683,31 @@ class QtPreferencesDialog(QtWidgets.QDialog):
 
         return widget
 
+    def _on_location_chosen(self, pathname, path_type, page_type, tree):
+        if not pathname:
+            return
+        pathname = QtCore.QFileInfo(pathname).canonicalFilePath() or pathname
+        self._add_path_qt(pathname, path_type, page_type, tree)
+
     def _check_path_exists_qt(self, pathname, page_type):
         """
         Check if a path exists in either whitelist or custom lists.
         Returns True if path exists, False otherwise.
         """
-        whitelist_paths = options.get_whitelist_paths() or []
-        custom_paths = options.get_custom_paths() or []
-
-        # Check in whitelist
-        for path_type, path in whitelist_paths:
-            if pathname == path:
-                msg = _("This path already exists in the allowlist.")
-                QtWidgets.QMessageBox.critical(
-                    self,
-                    _("Error"),
-                    msg,
-                    QtWidgets.QMessageBox.Ok,
-                )
-                return True
-
-        # Check in custom
-        for path_type, path in custom_paths:
-            if pathname == path:
-                msg = _("This path already exists in the custom list.")
-                QtWidgets.QMessageBox.critical(
-                    self,
-                    _("Error"),
-                    msg,
-                    QtWidgets.QMessageBox.Ok,
-                )
-                return True
-
-        return False
+        if pathname not in self._known_paths:
+            return False
+
+        if pathname in self._whitelist_set:
+            msg = _("This path already exists in the allowlist.")
+        else:
+            msg = _("This path already exists in the custom list.")
+        QtWidgets.QMessageBox.critical(
+            self,
+            _("Error"),
+            msg,
+            QtWidgets.QMessageBox.Ok,
+        )
+        return True
 
     def _add_path_qt(self, pathname, path_type, page_type, tree):
         """
@@ -580,20 +717,23 @@ class QtPreferencesDialog(QtWidgets.QDialog):
         if self._check_path_exists_qt(pathname, page_type):
             return
 
-        type_str = _('File') if path_type == 'file' else _('Folder')
+        type_str = _TR[path_type]
 
-        # Add to tree
+        # Add to tree and to the in-memory list, then persist once
         item = QtWidgets.QTreeWidgetItem([type_str, pathname])
         tree.addTopLevelItem(item)
+        tree._backing_list.append([path_type, pathname])
+        if page_type == LOCATIONS_WHITELIST:
+            self._whitelist_set.add(pathname)
+        else:
+            self._custom_set.add(pathname)
+        self._known_paths.add(pathname)
+        self._persist_locations(tree._backing_list, page_type)
 
-        # Update options
+    def _persist_locations(self, pathnames, page_type):
         if page_type == LOCATIONS_WHITELIST:
-            pathnames = options.get_whitelist_paths() or []
-            pathnames.append([path_type, pathname])
             options.set_whitelist_paths(pathnames)
         else:
-            pathnames = options.get_custom_paths() or []
-            pathnames.append([path_type, pathname])
             options.set_custom_paths(pathnames)
 
     def _remove_path_qt(self, tree, page_type):
@@ -605,27 +745,40 @@ class QtPreferencesDialog(QtWidgets.QDialog):
             return
 
         pathname = item.text(1)
+        backing = tree._backing_list
 
-        # Remove from tree
-        idx = tree.indexOfTopLevelItem(item)
-        if idx >= 0:
-            tree.takeTopLevelItem(idx)
-
-        # Remove from options
+        row = tree.indexOfTopLevelItem(item)
+        if row < 0:
+            return
+        idx = row
+        if not (idx < len(backing) and backing[idx][1] == pathname):
+            # Row indices drift from the stored list only if it held
+            # invalid entries that were skipped at build time; fall
+            # back to a scan for the matching path.
+            idx = next(
+                (i for i, p in enumerate(backing) if p[1] == pathname), -1)
+            if idx < 0:
+                return
+
+        tree.takeTopLevelItem(row)
+        del backing[idx]
         if page_type == LOCATIONS_WHITELIST:
-            pathnames = options.get_whitelist_paths() or []
-            pathnames = [p for p in pathnames if p[1] != pathname]
-            options.set_whitelist_paths(pathnames)
+            self._whitelist_set.discard(pathname)
         else:
-            pathnames = options.get_custom_paths() or []
-            pathnames = [p for p in pathnames if p[1] != pathname]
-            options.set_custom_paths(pathnames)
+            self._custom_set.discard(pathname)
+        if (pathname not in self._whitelist_set
+                and pathname not in self._custom_set):
+            self._known_paths.discard(pathname)
+        self._persist_locations(backing, page_type)
 
     # ---------- helpers / callbacks ----------
 
     def _set_option(self, key, value):
-        """Set simple boolean option and do any side effects."""
-        options.set(key, bool(value))
+        """Buffer a boolean option change and do any UI side effects.
+
+        The actual writes happen once in _on_accept, so flipping five
+        checkboxes costs one config save instead of five."""
+        self._pending_opts[key] = bool(value)
         if key == 'auto_hide':
             self.refresh_operations = True
         if key in ('check_online_updates', 'check_beta', 'update_winapp2'):
@@ -637,46 +790,45 @@ class QtPreferencesDialog(QtWidgets.QDialog):
                 if hasattr(self, 'cb_winapp2') and self.cb_winapp2 is not None:
                     self.cb_winapp2.setEnabled(enabled)
 
-    def _on_updates_toggled(self, checked):
-        self._set_option('check_online_updates', checked)
-
-    def _on_auto_hide_toggled(self, checked):
-        self._set_option('auto_hide', checked)
+    def _on_generic_toggled(self, checked):
+        """Shared slot for simple boolean checkboxes; the option key
+        is stored on the sender as the bb_option property."""
+        self._set_option(self.sender().property("bb_option"), checked)
 
     def _set_language_widgets_enabled(self, enabled: bool):
         # Enable/disable the language selection row
-        for i in range(self.lang_select_box.count()):
-            item = self.lang_select_box.itemAt(i)
-            w = item.widget()
-            if w is not None:
-                w.setEnabled(enabled)
+        for w in self._lang_widgets:
+            w.setEnabled(enabled)
 
     def _on_auto_detect_toggled(self, checked):
-        self._set_option('auto_detect_lang', checked)
+        # Written through immediately (not buffered): the translation
+        # setup below must see the new value.
+        options.set('auto_detect_lang', bool(checked))
         self._set_language_widgets_enabled(not checked)
         if checked:
             # Clear forced language
             options.set("forced_language", "", section="bleachbit")
         setup_translation()
+        _retranslate()
         self.refresh_operations = True
 
     def _on_language_combo_changed(self, index):
         if index < 0:
             return
-        text = self.lang_combo.itemText(index)
-        # text may be "Native (code)" or just "code"
-        lang_code = None
-        if "(" in text and text.endswith(")"):
-            lang_code = text.split("(")[-1].rstrip(")")
-        else:
-            lang_code = self.lang_combo.currentData() or text
+        # The language code is stored as userData when the combo is
+        # populated; the visible "Native (code)" label is display-only.
+        lang_code = self.lang_combo.itemData(index)
         if lang_code:
             options.set("forced_language", lang_code, section="bleachbit")
             setup_translation()
+            _retranslate()
             self.refresh_operations = True
 
     def _on_accept(self):
         """Handle OK button: commit and maybe refresh operations."""
+        for key, value in self._pending_opts.items():
+            options.set(key, value)
+        self._pending_opts.clear()
         self.accept()
         if self.refresh_operations and self.cb_refresh_operations is not None:
             try:
@@ -684,9 +836,17 @@ class QtPreferencesDialog(QtWidgets.QDialog):
             except Exception:
                 logger.exception("Error in cb_refresh_operations from preferences")
 
+    def reject(self):
+        """Discard buffered option changes on Cancel."""
+        self._pending_opts.clear()
+        super().reject()
+
     def _open_cookie_manager(self):
         """Open the cookie manager dialog."""
         dlg = QtCookieManagerDialog(self)
+        # The preferences dialog is a long-lived singleton, so free the
+        # cookie dialog explicitly instead of waiting for the parent.
+        dlg.setAttribute(QtCore.Qt.WA_DeleteOnClose)
         dlg.exec()
 
 
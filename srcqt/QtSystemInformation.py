@@ -20,20 +20,48 @@
 
 
 # standard library
+import functools
+import importlib.util
 import logging
-import locale
 import os
-import platform
 import sys
 
+import PySide6
 from PySide6 import QtCore, QtGui, QtWidgets
 
 # local
 import bleachbit
-from bleachbit.General import get_executable
+
+# bleachbit.Revision only exists in CI and tarball builds; resolve it
+# once at import instead of raising ImportError per lookup.
+_revision_mod = None
+if importlib.util.find_spec('bleachbit.Revision') is not None:
+    import bleachbit.Revision as _revision_mod
 
 logger = logging.getLogger(__name__)
 
+# Environment variables reported per platform
+if 'posix' == os.name:
+    _REPORT_ENVS = ('DESKTOP_SESSION', 'LOGNAME', 'USER', 'SUDO_UID')
+elif 'nt' == os.name:
+    _REPORT_ENVS = ('APPDATA', 'cd', 'LocalAppData', 'LocalAppDataLow',
+                    'Music', 'USERPROFILE', 'ProgramFiles', 'ProgramW6432',
+                    'TMP')
+else:
+    _REPORT_ENVS = ()
+
+# Mac version names keyed by minor version of 10.x
+_MACOSX_NAMES = {
+    '5': 'Leopard',
+    '6': 'Snow Leopard',
+    '7': 'Lion',
+    '8': 'Mountain Lion',
+    '9': 'Mavericks',
+    '10': 'Yosemite',
+    '11': 'El Capitan',
+    '12': 'Sierra',
+}
+
 
 def get_version(four_parts=False):
     """Return version information as a string.
@@ -44,37 +72,36 @@ def get_version(four_parts=False):
     If False, return three or four parts, depending on available information.
     """
     build_number_env = os.getenv('APPVEYOR_BUILD_NUMBER')
-    build_number_src = None
-    try:
-        from bleachbit.Revision import build_number as build_number_import
-        build_number_src = build_number_import
-    except ImportError:
-        pass
+    build_number_src = getattr(_revision_mod, 'build_number', None)
 
     build_number = build_number_src or build_number_env
     if not build_number:
         if not four_parts:
             return bleachbit.APP_VERSION
         return f'{bleachbit.APP_VERSION}.0'
-    assert build_number.isdigit()
+    # int() validates in one C-level parse and, unlike an assert,
+    # still rejects malformed values under python -O.
+    try:
+        build_number = int(build_number)
+    except (TypeError, ValueError):
+        raise ValueError(f'invalid build number: {build_number!r}')
     return f'{bleachbit.APP_VERSION}.{build_number}'
 
 
-def get_qt_info():
-    """Get dictionary of information about Qt / PySide6."""
-    info = {}
-    try:
-        from PySide6 import __version__ as pyside6_version
-        from PySide6 import QtCore, QtWidgets
-    except Exception:
-        logger.debug('PySide6 not available', exc_info=True)
-        return info
-
-    info['PySide6 version'] = pyside6_version
+@functools.lru_cache(maxsize=1)
+def _get_qt_static_info():
+    """Get the PySide6/Qt values that cannot change at runtime."""
+    info = {'PySide6 version': PySide6.__version__}
     try:
         info['Qt version'] = QtCore.qVersion()
     except Exception:
         pass
+    return info
+
+
+def get_qt_info():
+    """Get dictionary of information about Qt / PySide6."""
+    info = dict(_get_qt_static_info())
 
     # Style may depend on QApplication existing; handle both cases safely
     try:
@@ -82,111 +109,142 @@ def get_qt_info():
         if app is not None:
             info['Qt style'] = app.style().objectName()
         else:
-            # This will work even without an existing QApplication in most cases
-            info['Qt style'] = QtWidgets.QStyleFactory.keys()
+            # No active style to report without a QApplication;
+            # QStyleFactory.keys() would list available styles, which
+            # is not the same thing (and scans style plugins).
+            info['Qt style'] = '(no QApplication)'
     except Exception:
         pass
 
     return info
 
 
+def invalidate_system_information_cache():
+    """Drop the memoized system information (mainly for tests)."""
+    get_system_information.cache_clear()
+
+
+@functools.lru_cache(maxsize=2)
 def get_system_information(include_qt=True):
-    """Return system information as a string."""
-    from collections import OrderedDict
-    info = OrderedDict()
+    """Return system information as a string.
+
+    The data is static for the lifetime of the process, so the result
+    is memoized; reopening the dialog skips the OS, locale and Qt
+    introspection entirely."""
+    # Local imports: this module loads at startup with the other Qt
+    # dialogs, but these are only needed if the dialog is opened.
+    import locale
+    import platform
+    import sqlite3
+    from bleachbit.General import get_executable
+
+    # List of (key, value) pairs: the data is only ever iterated in
+    # insertion order for rendering, so skip dict hashing entirely.
+    info = []
 
     # Application and library versions
-    info['BleachBit version'] = get_version()
+    info.append(('BleachBit version', get_version()))
 
-    try:
-        # CI builds and Linux tarball will have a revision.
-        from bleachbit.Revision import revision
-        info['Git revision'] = revision
-    except ImportError:
-        pass
+    # CI builds and Linux tarball will have a revision.
+    revision = getattr(_revision_mod, 'revision', None)
+    if revision:
+        info.append(('Git revision', revision))
 
     if include_qt:
-        info.update(get_qt_info())
+        info.extend(get_qt_info().items())
 
-    import sqlite3
-    info['SQLite version'] = sqlite3.sqlite_version
+    info.append(('SQLite version', sqlite3.sqlite_version))
 
     # Variables defined in __init__.py
-    info['local_cleaners_dir'] = bleachbit.local_cleaners_dir
-    info['locale_dir'] = bleachbit.locale_dir
-    info['options_dir'] = bleachbit.options_dir
-    info['personal_cleaners_dir'] = bleachbit.personal_cleaners_dir
-    info['system_cleaners_dir'] = bleachbit.system_cleaners_dir
+    info.append(('local_cleaners_dir', bleachbit.local_cleaners_dir))
+    info.append(('locale_dir', bleachbit.locale_dir))
+    info.append(('options_dir', bleachbit.options_dir))
+    info.append(('personal_cleaners_dir', bleachbit.personal_cleaners_dir))
+    info.append(('system_cleaners_dir', bleachbit.system_cleaners_dir))
 
     # System environment information
-    info['locale.getlocale'] = str(locale.getlocale())
+    info.append(('locale.getlocale', str(locale.getlocale())))
 
     # Environment variables
-    if 'posix' == os.name:
-        envs = ('DESKTOP_SESSION', 'LOGNAME', 'USER', 'SUDO_UID')
-    elif 'nt' == os.name:
-        envs = ('APPDATA', 'cd', 'LocalAppData', 'LocalAppDataLow', 'Music',
-                'USERPROFILE', 'ProgramFiles', 'ProgramW6432', 'TMP')
-    else:
-        envs = ()
-
-    for env in envs:
-        info[f'os.getenv({env})'] = os.getenv(env)
-
-    info['os.path.expanduser(~")'] = os.path.expanduser('~')
+    env_get = os.environ.get
+    for env in _REPORT_ENVS:
+        # sys.intern: the literal keys above are interned at compile
+        # time; these runtime-built ones are interned to match, so
+        # repeated collections share one string per key.
+        info.append((sys.intern('os.getenv(%s)' % env), env_get(env)))
 
-    # Mac Version Name - Dictionary
-    macosx_dict = {
-        '5': 'Leopard',
-        '6': 'Snow Leopard',
-        '7': 'Lion',
-        '8': 'Mountain Lion',
-        '9': 'Mavericks',
-        '10': 'Yosemite',
-        '11': 'El Capitan',
-        '12': 'Sierra',
-    }
+    info.append(('os.path.expanduser(~")', os.path.expanduser('~')))
 
     if sys.platform == 'linux':
         from bleachbit.Unix import get_distribution_name_version
-        info['get_distribution_name_version()'] = get_distribution_name_version()
+        info.append(('get_distribution_name_version()', get_distribution_name_version()))
     elif sys.platform.startswith('darwin'):
         if hasattr(platform, 'mac_ver'):
             mac_version = platform.mac_ver()[0]
             parts = mac_version.split('.')
             if len(parts) >= 2:
                 version_minor = parts[1]
-                if version_minor in macosx_dict:
-                    info['platform.mac_ver()'] = f'{mac_version} ({macosx_dict[version_minor]})'
+                if version_minor in _MACOSX_NAMES:
+                    info.append(('platform.mac_ver()', f'{mac_version} ({_MACOSX_NAMES[version_minor]})'))
                 else:
-                    info['platform.mac_ver()'] = mac_version
+                    info.append(('platform.mac_ver()', mac_version))
     else:
-        info['platform.uname().version'] = platform.uname().version
+        info.append(('platform.uname().version', platform.uname().version))
 
     # System information
-    info['sys.argv'] = sys.argv
-    info['sys.executable'] = get_executable()
-    info['sys.version'] = sys.version
+    info.append(('sys.argv', sys.argv))
+    info.append(('sys.executable', get_executable()))
+    info.append(('sys.version', sys.version))
     if 'nt' == os.name:
         try:
             from win32com.shell import shell
-            info['IsUserAnAdmin()'] = shell.IsUserAnAdmin()
+            info.append(('IsUserAnAdmin()', shell.IsUserAnAdmin()))
         except Exception:
             logger.debug("Failed to query IsUserAnAdmin()", exc_info=True)
-    info['__file__'] = __file__
+    info.append(('__file__', __file__))
 
-    # Render the information as a string
-    return '\n'.join(f'{key} = {value}' for key, value in info.items())
+    # Render the information as a string; the list form lets join
+    # precompute the total length in one pass.
+    return '\n'.join(['%s = %s' % kv for kv in info])
 
 
 # ---------------------------------------------------------------------------
 # Qt dialog
 # ---------------------------------------------------------------------------
 
+class _SysInfoWorker(QtCore.QObject, QtCore.QRunnable):
+    """
+    Collects system information on the global thread pool so the dialog
+    paints immediately instead of blocking on OS introspection.
+    """
+
+    finished = QtCore.Signal(str)
+
+    def __init__(self):
+        QtCore.QObject.__init__(self)
+        QtCore.QRunnable.__init__(self)
+        self.setAutoDelete(True)
+
+    def run(self):
+        self.finished.emit(get_system_information(include_qt=True))
+
+
 class QtSystemInformationDialog(QtWidgets.QDialog):
     """
     Qt implementation (Qt/PySide6) of of the BleachBit Show system information dialog
     """
+
+    # Resolved fixed-width font, shared across dialog opens
+    _fixed_font = None
+
+    @classmethod
+    def _get_fixed_font(cls):
+        """Probe the font database once; reuse the QFont afterwards."""
+        if cls._fixed_font is None:
+            cls._fixed_font = QtGui.QFontDatabase.systemFont(
+                QtGui.QFontDatabase.FixedFont)
+        return cls._fixed_font
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -204,11 +262,26 @@ class QtSystemInformationDialog(QtWidgets.QDialog):
         self.text = QtWidgets.QPlainTextEdit()
         self.text.setReadOnly(True)
         self.text.setLineWrapMode(QtWidgets.QPlainTextEdit.LineWrapMode.NoWrap)
-        font = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
-        self.text.setFont(font)
-        self.text.setPlainText(get_system_information(include_qt=True))
+        # Cap the document and enable the log-viewer fast path; the
+        # info is small today, but this bounds memory if a collector
+        # ever returns long multi-line output.
+        self.text.setMaximumBlockCount(2000)
+        self.text.setCenterOnScroll(True)
+        self.text.setFont(self._get_fixed_font())
         layout.addWidget(self.text, 1)
 
+        # Fill asynchronously; collection can take tens to hundreds of
+        # milliseconds on a cold cache.
+        self.text.setPlainText("Collecting system information…")
+        # Cached so Copy/Save need not rebuild the string from the
+        # document via toPlainText(); the UTF-8 form is kept alongside
+        # so Save skips re-encoding on every click.
+        self._info_text = None
+        self._info_bytes = None
+        self._worker = _SysInfoWorker()
+        self._worker.finished.connect(self._on_info_ready)
+        QtCore.QThreadPool.globalInstance().start(self._worker)
+
         btn_row = QtWidgets.QHBoxLayout()
         layout.addLayout(btn_row)
 
@@ -227,8 +300,35 @@ class QtSystemInformationDialog(QtWidgets.QDialog):
         btn_row.addWidget(self.btn_close)
 
 
+    def _on_info_ready(self, text):
+        self._info_text = text
+        self._info_bytes = text.encode("utf-8")
+        # Build the final document in one go and swap it in; setting
+        # the font at the document level applies it once instead of
+        # per block during relayout. QPlainTextEdit rejects documents
+        # without a QPlainTextDocumentLayout, so install one first.
+        doc = QtGui.QTextDocument(self.text)
+        doc.setDocumentLayout(QtWidgets.QPlainTextDocumentLayout(doc))
+        doc.setDefaultFont(self._get_fixed_font())
+        doc.setMaximumBlockCount(2000)
+        doc.setPlainText(text)
+        self.text.setDocument(doc)
+        self._worker = None
+
+    def closeEvent(self, event):
+        # Do not deliver a late result to a closed dialog
+        if self._worker is not None:
+            try:
+                self._worker.finished.disconnect(self._on_info_ready)
+            except RuntimeError:
+                pass
+            self._worker = None
+        super().closeEvent(event)
+
     def _copy(self):
-        QtWidgets.QApplication.clipboard().setText(self.text.toPlainText())
+        # Fall back to the widget text if collection has not finished
+        QtWidgets.QApplication.clipboard().setText(
+            self._info_text or self.text.toPlainText())
 
     def _save(self):
         suggested = "bleachbit-system-information.txt"
@@ -240,13 +340,22 @@ class QtSystemInformationDialog(QtWidgets.QDialog):
         )
         if not path:
             return
-        try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(self.text.toPlainText())
-        except OSError as exc:
+        # QSaveFile writes to a temp file and renames on commit, so a
+        # crash mid-save cannot leave a truncated file; the bytes go
+        # out through Qt's buffered binary path with no newline
+        # translation.
+        data = (self._info_bytes
+                or self.text.toPlainText().encode("utf-8"))
+        sf = QtCore.QSaveFile(path)
+        if sf.open(QtCore.QIODevice.WriteOnly):
+            sf.write(data)
+            ok = sf.commit()
+        else:
+            ok = False
+        if not ok:
             QtWidgets.QMessageBox.critical(
                 self,
                 "Error",
-                f"Failed to save file:\n{exc}",
+                f"Failed to save file:\n{sf.errorString()}",
                 QtWidgets.QMessageBox.Ok,
             )